@@ -4,44 +4,89 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
-
 from app.utils.path_validation import normalize_sqlite_path, resolve_path_safely
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# abspath is enough here: symlinked checkouts are not a supported layout, so skip realpath
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "email_handler.db"
 DEFAULT_LOG_DIR = PROJECT_ROOT / "data" / "logs"
 
+# Resolved once at import so load_config never has to re-resolve the defaults
+_DEFAULT_CACHE_DIR = (PROJECT_ROOT / "data" / "cache").resolve()
+_DEFAULT_INPUT_DIR = (PROJECT_ROOT / "data" / "input").resolve()
+_DEFAULT_OUTPUT_DIR = (PROJECT_ROOT / "data" / "output").resolve()
+_DEFAULT_SCRIPTS_DIR = (PROJECT_ROOT / "data" / "scripts").resolve()
+_DEFAULT_LOG_DIR = DEFAULT_LOG_DIR.resolve()
+
 
 @dataclass(slots=True)
 class AppConfig:
     database_url: str = f"sqlite:///{DEFAULT_DB_PATH}"
-    pickle_cache_dir: Path = PROJECT_ROOT / "data" / "cache"
-    input_dir: Path = PROJECT_ROOT / "data" / "input"
-    output_dir: Path = PROJECT_ROOT / "data" / "output"
-    scripts_dir: Path = PROJECT_ROOT / "data" / "scripts"
+    pickle_cache_dir: Path = _DEFAULT_CACHE_DIR
+    input_dir: Path = _DEFAULT_INPUT_DIR
+    output_dir: Path = _DEFAULT_OUTPUT_DIR
+    scripts_dir: Path = _DEFAULT_SCRIPTS_DIR
     log_dir: Path = DEFAULT_LOG_DIR
     env_name: str = "local"
 
 
 def _resolve_path_from_env(env_value: Optional[str], default: Path, base_path: Optional[Path] = None) -> Path:
-    """Resolve a path from environment variable or default, handling relative paths correctly."""
+    """Resolve a path from environment variable or default, handling relative paths correctly.
+
+    ``default`` must already be resolved; the module-level ``_DEFAULT_*`` constants are.
+    """
     if env_value:
+        # Absolute paths without traversal or home segments need no resolution
+        if os.path.isabs(env_value) and ".." not in env_value and "~" not in env_value:
+            return Path(env_value)
         # Resolve relative to PROJECT_ROOT if relative, or use absolute path
         return resolve_path_safely(env_value, base_path or PROJECT_ROOT)
-    return default.resolve()
+    return default
+
+
+_CONFIG_ENV_KEYS = (
+    "EMAIL_HANDLER_DATABASE_URL",
+    "EMAIL_HANDLER_CACHE_DIR",
+    "EMAIL_HANDLER_INPUT_DIR",
+    "EMAIL_HANDLER_OUTPUT_DIR",
+    "EMAIL_HANDLER_SCRIPTS_DIR",
+    "EMAIL_HANDLER_LOG_DIR",
+    "EMAIL_HANDLER_ENV",
+)
 
 
 def load_config(env_file: Optional[Path] = None) -> AppConfig:
+    """Load the application configuration, reusing the cached result while the .env file and environment are unchanged."""
     if env_file is None:
         env_file = PROJECT_ROOT / ".env"
 
-    load_dotenv(dotenv_path=env_file, override=False)
+    try:
+        mtime: Optional[int] = env_file.stat().st_mtime_ns
+    except OSError:
+        mtime = None
 
-    database_url = os.getenv("EMAIL_HANDLER_DATABASE_URL")
+    environ = tuple(os.environ.get(key) for key in _CONFIG_ENV_KEYS)
+    return _load_config_impl(env_file, mtime, environ)
+
+
+@lru_cache(maxsize=8)
+def _load_config_impl(
+    env_file: Path, mtime: Optional[int], environ: tuple[Optional[str], ...]
+) -> AppConfig:
+    # ``mtime`` and ``environ`` are only part of the cache key so edits to the .env file
+    # or to the process environment invalidate entries
+    # Imported lazily: python-dotenv is only needed when the cache misses
+    from dotenv import dotenv_values
+
+    # Process environment wins over the file, as with ``load_dotenv(override=False)``, but
+    # os.environ is left untouched so the cache key stays stable across calls
+    env = {**dotenv_values(env_file), **os.environ}
+
+    database_url = env.get("EMAIL_HANDLER_DATABASE_URL")
     if not database_url:
         database_url = f"sqlite:///{DEFAULT_DB_PATH}"
     else:
@@ -52,22 +97,26 @@ def load_config(env_file: Optional[Path] = None) -> AppConfig:
     cfg = AppConfig(
         database_url=database_url,
         pickle_cache_dir=_resolve_path_from_env(
-            os.getenv("EMAIL_HANDLER_CACHE_DIR"), PROJECT_ROOT / "data" / "cache"
+            env.get("EMAIL_HANDLER_CACHE_DIR"), _DEFAULT_CACHE_DIR
         ),
         input_dir=_resolve_path_from_env(
-            os.getenv("EMAIL_HANDLER_INPUT_DIR"), PROJECT_ROOT / "data" / "input"
+            env.get("EMAIL_HANDLER_INPUT_DIR"), _DEFAULT_INPUT_DIR
         ),
         output_dir=_resolve_path_from_env(
-            os.getenv("EMAIL_HANDLER_OUTPUT_DIR"), PROJECT_ROOT / "data" / "output"
+            env.get("EMAIL_HANDLER_OUTPUT_DIR"), _DEFAULT_OUTPUT_DIR
         ),
         scripts_dir=_resolve_path_from_env(
-            os.getenv("EMAIL_HANDLER_SCRIPTS_DIR"), PROJECT_ROOT / "data" / "scripts"
+            env.get("EMAIL_HANDLER_SCRIPTS_DIR"), _DEFAULT_SCRIPTS_DIR
         ),
         log_dir=_resolve_path_from_env(
-            os.getenv("EMAIL_HANDLER_LOG_DIR"), DEFAULT_LOG_DIR
+            env.get("EMAIL_HANDLER_LOG_DIR"), _DEFAULT_LOG_DIR
         ),
-        env_name=os.getenv("EMAIL_HANDLER_ENV", "local"),
+        env_name=env.get("EMAIL_HANDLER_ENV", "local"),
     )
 
     return cfg
 
+
+def clear_config_cache() -> None:
+    """Forget cached configurations, e.g. after the .env file was rewritten within one mtime tick."""
+    _load_config_impl.cache_clear()
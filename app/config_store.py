@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import fields
 from pathlib import Path
 from typing import Dict
 
-from dotenv import dotenv_values
 from loguru import logger
 
-from app.config import AppConfig, PROJECT_ROOT
+from app.config import AppConfig, PROJECT_ROOT, clear_config_cache
 from app.utils.path_validation import validate_path
 
 ENV_KEY_MAP = {
@@ -21,6 +22,10 @@ ENV_KEY_MAP = {
     "env_name": "EMAIL_HANDLER_ENV",
 }
 
+# AppConfig is fixed, so the path-typed fields can be determined once at import
+# (annotations are strings because app.config uses postponed evaluation)
+_PATH_FIELDS = frozenset(field.name for field in fields(AppConfig) if field.type in (Path, "Path"))
+
 
 def _config_to_env_values(config: AppConfig) -> Dict[str, str]:
     values: Dict[str, str] = {}
@@ -29,7 +34,7 @@ def _config_to_env_values(config: AppConfig) -> Dict[str, str]:
         if value is None:
             continue
         # For paths, validate before saving
-        if isinstance(value, Path):
+        if field_name in _PATH_FIELDS:
             is_valid, error = validate_path(value)
             if not is_valid:
                 logger.warning("Path validation failed for %s: %s", field_name, error)
@@ -43,10 +48,32 @@ def save_config(config: AppConfig, env_file: Path | None = None) -> Path:
     target_file = env_file or PROJECT_ROOT / ".env"
     target_file.parent.mkdir(parents=True, exist_ok=True)
 
-    existing = dotenv_values(target_file) if target_file.exists() else {}
-    updated = {**existing, **_config_to_env_values(config)}
+    lines = target_file.read_text(encoding="utf-8").splitlines() if target_file.exists() else []
+
+    # Map each key to its line so updates are rewritten in place, keeping comments and order
+    positions: Dict[str, int] = {}
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, _ = stripped.partition("=")
+        if sep:
+            positions[key.removeprefix("export ").strip()] = index
+
+    # Sort only when creating the file; afterwards keep insertion order for stable diffs
+    values = _config_to_env_values(config)
+    items = sorted(values.items()) if not lines else values.items()
+    for key, value in items:
+        if key in positions:
+            lines[positions[key]] = f"{key}={value}"
+        else:
+            lines.append(f"{key}={value}")
 
-    lines = [f"{key}={value}" for key, value in sorted(updated.items()) if value is not None]
-    target_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Write encoded bytes to a sibling file and swap it in so readers never see a partial .env
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    tmp_file = target_file.with_suffix(target_file.suffix + ".tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, target_file)
+    clear_config_cache()
     return target_file
 
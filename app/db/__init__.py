@@ -1,17 +1,23 @@
 """Database package exposing session utilities for the Email Handler app."""
 
 from .init_db import (
+    bulk_session_scope,
     get_engine,
+    get_read_engine,
     get_session_factory,
     init_db,
+    read_session_scope,
     reset_engine,
     session_scope,
 )
 
 __all__ = [
+    "bulk_session_scope",
     "get_engine",
+    "get_read_engine",
     "get_session_factory",
     "init_db",
+    "read_session_scope",
     "reset_engine",
     "session_scope",
 ]
@@ -4,33 +4,111 @@ from __future__ import annotations
 
 import os
 import platform
+import sqlite3
+import threading
 from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator, Optional
+from weakref import WeakSet
 
 from loguru import logger
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import inspect
+from sqlalchemy.pool import QueuePool
 
-from app.config import AppConfig, load_config
+from app.config import AppConfig, clear_config_cache, load_config
 from app.utils.error_handling import format_connection_error, format_database_error
 
 from .models import Base
 
 _ENGINE: Engine | None = None
+# Unmasked URL of _ENGINE; str(engine.url) hides passwords and never equals the configured URL
+_ENGINE_URL: str | None = None
 _SESSION_FACTORY: sessionmaker[Session] | None = None
+# Read-only companion engine for SQLite file databases; WAL lets its readers run alongside the writer
+_READ_ENGINE: Engine | None = None
+_READ_SESSION_FACTORY: sessionmaker[Session] | None = None
+_READ_POOL_SIZE = 8
+# Periodic PRAGMA optimize / WAL checkpoint for the active SQLite engine
+_MAINTENANCE_INTERVAL_SECONDS = 900
+_MAINTENANCE_TIMER: threading.Timer | None = None
+# Directories already created by init_db during this process; cleared by reset_engine
+_ENSURED_DIRS: set[str] = set()
+# Engines whose tables have been created and patched; init_db is a no-op for these
+_INITIALIZED_ENGINES: "WeakSet[Engine]" = WeakSet()
+# Stored in SQLite's PRAGMA user_version once every patch below is applied; bump when adding
+# patches or model indexes that existing databases need
+_SCHEMA_VERSION = 1
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Applied to every new SQLite connection, read-only ones included, one at a time so a pragma
+# that fails on one connection cannot skip the rest
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA secure_delete=OFF",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-40000",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+# Persistent file settings for a brand-new database file; they only take effect before the
+# header is written, so the writer applies them ahead of the WAL switch, which writes it. Free
+# pages are then reclaimed by the periodic incremental_vacuum.
+_SQLITE_CREATE_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA auto_vacuum=INCREMENTAL",
+)
+
+
+@event.listens_for(Engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune every new SQLite DBAPI connection, including ones the pool opens later."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    for pragma in _SQLITE_CONNECTION_PRAGMAS:
+        try:
+            dbapi_connection.execute(pragma)
+        except sqlite3.Error as exc:
+            # Log warning but don't fail - the pragmas are optional optimizations
+            logger.warning("Failed to apply SQLite pragma {!r}: {}", pragma, exc)
+
+
+def _prepare_sqlite_writer_connection(dbapi_connection, _connection_record) -> None:
+    """Set up the file on each new writer connection: create-time pragmas once, then WAL."""
+    try:
+        if not dbapi_connection.execute("PRAGMA page_count").fetchone()[0]:
+            for pragma in _SQLITE_CREATE_PRAGMAS:
+                dbapi_connection.execute(pragma).fetchall()
+        # WAL lets the read-only pool proceed alongside the writer. It is persistent, so this is a
+        # no-op once set, and it also converts databases created before the switch
+        dbapi_connection.execute("PRAGMA journal_mode=WAL").fetchall()
+    except sqlite3.Error as exc:
+        logger.warning("Failed to prepare SQLite database file: {}", exc)
+
+
+def _log_database_error(context) -> None:
+    """Log every failed statement on the app engines once, in place of per-repository try/except wrappers."""
+    statement = (context.statement or "")[:200]
+    error_type = type(context.original_exception).__name__
+    if isinstance(context.sqlalchemy_exception, IntegrityError):
+        # Constraint violations are expected; the upsert helpers catch, log and rewrap them
+        logger.debug("Database integrity error ({}) running: {}", error_type, statement)
+        return
+    logger.error("Database error ({}) running: {}", error_type, statement)
 
 
 def _get_engine_connect_args(database_url: str) -> dict:
-    """Get connection arguments for SQLite engine, including Windows-specific optimizations."""
+    """Get connection arguments for SQLite engine."""
     connect_args = {}
     
-    # Enable WAL mode on Windows for better concurrent access
-    if platform.system() == "Windows" and database_url.startswith("sqlite:///"):
-        # WAL mode improves concurrent read access and reduces locking issues
+    # Streamlit serves sessions from multiple threads on every platform
+    if database_url.startswith("sqlite:///"):
+        # Connections may be used from a thread other than the one that opened them
         connect_args["check_same_thread"] = False
         # Set timeout for locked database (30 seconds)
         connect_args["timeout"] = 30.0
@@ -38,6 +116,23 @@ def _get_engine_connect_args(database_url: str) -> dict:
     return connect_args
 
 
+def _engine_kwargs(db_url: str) -> dict:
+    """Build ``create_engine`` keyword arguments, sizing the pool for non-SQLite backends.
+
+    SQLite uses its own singleton/null pools, so pool sizing is only applied to server databases.
+    """
+    kwargs: dict = {"echo": False, "future": True, "connect_args": _get_engine_connect_args(db_url)}
+    if not db_url.startswith("sqlite:"):
+        kwargs.update(
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            pool_timeout=30,
+        )
+    return kwargs
+
+
 def _validate_database_accessibility(db_url: str) -> tuple[bool, Optional[str]]:
     """Validate that the database file is accessible.
     
@@ -54,7 +149,7 @@ def _validate_database_accessibility(db_url: str) -> tuple[bool, Optional[str]]:
     file_path = db_url.replace("sqlite:///", "")
     
     # Handle absolute Windows paths
-    if file_path.startswith("/") and platform.system() == "Windows":
+    if file_path.startswith("/") and _IS_WINDOWS:
         # Remove leading slash for Windows absolute paths
         file_path = file_path[1:]
     
@@ -82,6 +177,12 @@ def _validate_database_accessibility(db_url: str) -> tuple[bool, Optional[str]]:
     return True, None
 
 
+@lru_cache(maxsize=4)
+def _validate_database_accessibility_cached(db_url: str) -> tuple[bool, Optional[str]]:
+    """Memoized ``_validate_database_accessibility``; cleared by ``reset_engine`` and on failure."""
+    return _validate_database_accessibility(db_url)
+
+
 def get_engine(database_url: Optional[str] = None, *, config: Optional[AppConfig] = None) -> Engine:
     """Get or create the database engine with error handling.
     
@@ -89,14 +190,23 @@ def get_engine(database_url: Optional[str] = None, *, config: Optional[AppConfig
         OperationalError: If database connection fails
         PermissionError: If database file is not accessible
     """
-    global _ENGINE
+    global _ENGINE, _ENGINE_URL
+
+    # Hot path: the cached engine is reused unless a different URL or config is requested
+    if _ENGINE is not None:
+        if database_url is None and config is None:
+            return _ENGINE
+        if (database_url or config.database_url) == _ENGINE_URL:
+            return _ENGINE
 
     cfg = config or load_config()
     db_url = database_url or cfg.database_url
 
     # Validate database accessibility before creating engine
-    is_accessible, error_msg = _validate_database_accessibility(db_url)
+    is_accessible, error_msg = _validate_database_accessibility_cached(db_url)
     if not is_accessible:
+        # Don't remember failures so the check is retried once the problem is fixed
+        _validate_database_accessibility_cached.cache_clear()
         logger.error("Database accessibility check failed: %s", error_msg)
         raise OperationalError(
             error_msg or "Database is not accessible",
@@ -104,20 +214,19 @@ def get_engine(database_url: Optional[str] = None, *, config: Optional[AppConfig
             None
         )
 
-    connect_args = _get_engine_connect_args(db_url)
+    engine_kwargs = _engine_kwargs(db_url)
 
     try:
-        if _ENGINE is None:
-            _ENGINE = create_engine(db_url, echo=False, future=True, connect_args=connect_args)
-            # Enable WAL mode for SQLite on Windows
-            if platform.system() == "Windows" and db_url.startswith("sqlite:///"):
-                _enable_wal_mode(_ENGINE, db_url)
-        elif str(_ENGINE.url) != db_url:
-            _ENGINE.dispose()
-            _ENGINE = create_engine(db_url, echo=False, future=True, connect_args=connect_args)
-            # Enable WAL mode for new engine
-            if platform.system() == "Windows" and db_url.startswith("sqlite:///"):
-                _enable_wal_mode(_ENGINE, db_url)
+        if _ENGINE is None or _ENGINE_URL != db_url:
+            _dispose_read_engine()
+            if _ENGINE is not None:
+                _ENGINE.dispose()
+            _ENGINE = create_engine(db_url, **engine_kwargs)
+            _ENGINE_URL = db_url
+            event.listen(_ENGINE, "handle_error", _log_database_error)
+            if db_url.startswith("sqlite:///"):
+                event.listen(_ENGINE, "connect", _prepare_sqlite_writer_connection)
+                _start_sqlite_maintenance(_ENGINE)
     except (OperationalError, SQLAlchemyError) as exc:
         error_msg = format_connection_error(exc, db_url)
         logger.error("Failed to create database engine: %s", exc)
@@ -130,23 +239,120 @@ def get_engine(database_url: Optional[str] = None, *, config: Optional[AppConfig
     return _ENGINE
 
 
-def _enable_wal_mode(engine: Engine, db_url: str) -> None:
-    """Enable WAL mode for SQLite database.
-    
-    Args:
-        engine: SQLAlchemy engine
-        db_url: Database URL for error context
+def get_read_engine() -> Engine:
+    """Get or create the read-only engine used by ``read_session_scope``.
+
+    For SQLite file databases this opens the file with ``mode=ro`` through a pool of
+    ``_READ_POOL_SIZE`` connections, so concurrent page renders read from their own
+    connections instead of queueing behind the writer. Other backends share the main engine.
+
+    Raises:
+        OperationalError: If database connection fails
+    """
+    global _READ_ENGINE, _READ_SESSION_FACTORY
+
+    engine = get_engine()
+    if _READ_ENGINE is not None:
+        return _READ_ENGINE
+
+    db_path = engine.url.database
+    if engine.url.get_backend_name() != "sqlite" or not db_path or db_path == ":memory:":
+        return engine
+
+    # A writer connection creates the file and switches it to WAL before any reader opens it
+    with engine.connect():
+        pass
+    read_url = engine.url.set(
+        database=f"file:{Path(db_path).as_posix()}", query={"mode": "ro", "uri": "true"}
+    )
+    try:
+        _READ_ENGINE = create_engine(
+            read_url,
+            echo=False,
+            future=True,
+            connect_args=_get_engine_connect_args(str(engine.url)),
+            poolclass=QueuePool,
+            pool_size=_READ_POOL_SIZE,
+            max_overflow=0,
+            pool_pre_ping=True,
+        )
+    except (OperationalError, SQLAlchemyError) as exc:
+        logger.error("Failed to create read-only database engine: {}", exc)
+        raise OperationalError(format_connection_error(exc, str(engine.url)), None, None) from exc
+    event.listen(_READ_ENGINE, "handle_error", _log_database_error)
+    _READ_SESSION_FACTORY = _build_session_factory(_READ_ENGINE)
+    return _READ_ENGINE
+
+
+def _dispose_read_engine() -> None:
+    global _READ_ENGINE, _READ_SESSION_FACTORY
+    if _READ_ENGINE is not None:
+        _READ_ENGINE.dispose()
+    _READ_ENGINE = None
+    _READ_SESSION_FACTORY = None
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections, e.g. before the database file is deleted.
+
+    The engines stay usable and reconnect on next use; ``reset_engine`` restarts maintenance.
     """
+    _stop_sqlite_maintenance()
+    _dispose_read_engine()
+    if _ENGINE is not None:
+        _ENGINE.dispose()
+
+
+def _run_sqlite_maintenance(engine: Engine) -> None:
+    """Refresh planner statistics, reclaim free pages and truncate the WAL, then schedule the next run."""
+    if engine is not _ENGINE:
+        # The engine was replaced or disposed; its maintenance loop ends here
+        return
     try:
         with engine.connect() as conn:
-            conn.execute(text("PRAGMA journal_mode=WAL"))
-            conn.commit()
-        logger.debug("Enabled WAL mode for SQLite database")
+            conn.exec_driver_sql("PRAGMA optimize")
+            # No-op unless the database was created with auto_vacuum=INCREMENTAL. SQLite frees one
+            # page per step, and execute() steps a row-less pragma only once; executescript steps
+            # it to completion
+            conn.connection.driver_connection.executescript("PRAGMA incremental_vacuum(1000)")
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        logger.debug("Ran periodic SQLite maintenance")
     except Exception as exc:
-        # Log warning but don't fail - WAL mode is optional optimization
-        logger.warning("Failed to enable WAL mode for SQLite database at %s: %s", db_url, exc)
-        # Note: This error is logged but not raised, as WAL mode is an optimization
-        # The database will still work without WAL mode, just with potentially worse concurrency
+        logger.warning("Periodic SQLite maintenance failed: {}", exc)
+    _schedule_sqlite_maintenance(engine)
+
+
+def _schedule_sqlite_maintenance(engine: Engine) -> None:
+    global _MAINTENANCE_TIMER
+    timer = threading.Timer(_MAINTENANCE_INTERVAL_SECONDS, _run_sqlite_maintenance, args=(engine,))
+    timer.daemon = True
+    _MAINTENANCE_TIMER = timer
+    timer.start()
+
+
+def _start_sqlite_maintenance(engine: Engine) -> None:
+    """Start background ``PRAGMA optimize``/WAL checkpointing for a new SQLite engine.
+
+    ``PRAGMA optimize`` is also run whenever a pooled connection is closed, as the
+    SQLite documentation recommends.
+    """
+
+    @event.listens_for(engine, "close")
+    def _optimize_on_close(dbapi_connection, _connection_record) -> None:
+        try:
+            dbapi_connection.execute("PRAGMA optimize")
+        except Exception as exc:
+            logger.debug("PRAGMA optimize on close failed: {}", exc)
+
+    _stop_sqlite_maintenance()
+    _schedule_sqlite_maintenance(engine)
+
+
+def _stop_sqlite_maintenance() -> None:
+    global _MAINTENANCE_TIMER
+    if _MAINTENANCE_TIMER is not None:
+        _MAINTENANCE_TIMER.cancel()
+        _MAINTENANCE_TIMER = None
 
 
 def _build_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -161,23 +367,41 @@ def _build_session_factory(engine: Engine) -> sessionmaker[Session]:
 
 def get_session_factory(config: Optional[AppConfig] = None) -> sessionmaker[Session]:
     global _SESSION_FACTORY
+    if _SESSION_FACTORY is not None and config is None:
+        return _SESSION_FACTORY
     engine = get_engine(config=config)
     if _SESSION_FACTORY is None:
         _SESSION_FACTORY = _build_session_factory(engine)
     return _SESSION_FACTORY
 
 
+def _ensure_factory() -> sessionmaker[Session]:
+    """Return the process-wide session factory, building it on first use.
+
+    Engine creation failures are already wrapped in ``OperationalError`` by ``get_engine``.
+    """
+    global _SESSION_FACTORY
+    if _SESSION_FACTORY is None:
+        _SESSION_FACTORY = get_session_factory()
+    return _SESSION_FACTORY
+
+
 def reset_engine(config: AppConfig) -> None:
     """Rebuild the SQLAlchemy engine and session factory for the supplied config.
     
     Raises:
         OperationalError: If database connection fails
     """
-    global _ENGINE, _SESSION_FACTORY
+    global _ENGINE, _ENGINE_URL, _SESSION_FACTORY
+
+    clear_config_cache()
+    _validate_database_accessibility_cached.cache_clear()
+    _ENSURED_DIRS.clear()
 
     # Validate database accessibility before resetting
-    is_accessible, error_msg = _validate_database_accessibility(config.database_url)
+    is_accessible, error_msg = _validate_database_accessibility_cached(config.database_url)
     if not is_accessible:
+        _validate_database_accessibility_cached.cache_clear()
         logger.error("Database accessibility check failed during reset: %s", error_msg)
         raise OperationalError(
             error_msg or "Database is not accessible",
@@ -185,58 +409,68 @@ def reset_engine(config: AppConfig) -> None:
             None
         )
 
+    _stop_sqlite_maintenance()
+    _dispose_read_engine()
     if _ENGINE is not None:
         _ENGINE.dispose()
+    _ENGINE = None
+    _ENGINE_URL = None
+    _SESSION_FACTORY = None
+
+    # get_engine owns engine construction, pragma setup and error wrapping
+    engine = get_engine(config=config)
+    _SESSION_FACTORY = _build_session_factory(engine)
+    init_db(engine=engine, config=config)
 
-    try:
-        connect_args = _get_engine_connect_args(config.database_url)
-        _ENGINE = create_engine(config.database_url, echo=False, future=True, connect_args=connect_args)
-        
-        # Enable WAL mode for SQLite on Windows
-        if platform.system() == "Windows" and config.database_url.startswith("sqlite:///"):
-            _enable_wal_mode(_ENGINE, config.database_url)
-    except (OperationalError, SQLAlchemyError) as exc:
-        error_msg = format_connection_error(exc, config.database_url)
-        logger.error("Failed to reset database engine: %s", exc)
-        raise OperationalError(error_msg, None, None) from exc
-    except Exception as exc:
-        error_msg = format_connection_error(exc, config.database_url)
-        logger.exception("Unexpected error resetting database engine: %s", exc)
-        raise OperationalError(error_msg, None, None) from exc
-    
-    _SESSION_FACTORY = _build_session_factory(_ENGINE)
-    init_db(engine=_ENGINE, config=config)
+
+def _ensure_directories(*paths: Path) -> None:
+    """Create the given directories, skipping any that is an ancestor of another one.
+
+    ``os.makedirs`` creates missing parents itself, so only the leaves need a call.
+    """
+    unique = {path for path in paths if str(path) not in _ENSURED_DIRS}
+    ancestors = {parent for path in unique for parent in path.parents}
+    for path in sorted(unique - ancestors, key=lambda p: len(p.parts)):
+        os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.update(str(path) for path in unique)
 
 
 def init_db(*, engine: Optional[Engine] = None, config: Optional[AppConfig] = None) -> None:
     cfg = config or load_config()
-    cfg.pickle_cache_dir.mkdir(parents=True, exist_ok=True)
-    cfg.input_dir.mkdir(parents=True, exist_ok=True)
-    cfg.output_dir.mkdir(parents=True, exist_ok=True)
-    cfg.log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_directories(cfg.pickle_cache_dir, cfg.input_dir, cfg.output_dir, cfg.log_dir)
 
     if engine is None:
         engine = get_engine(config=cfg)
 
+    # Pages call init_db on every rerun; the schema only needs checking once per engine
+    if engine in _INITIALIZED_ENGINES:
+        return
+
     Base.metadata.create_all(bind=engine)
     _apply_schema_patches(engine)
 
+    if engine.url.get_backend_name() == "sqlite":
+        # Give the query planner fresh statistics once per engine
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("ANALYZE")
+                conn.exec_driver_sql("PRAGMA optimize")
+        except Exception as exc:
+            logger.warning("Failed to analyze SQLite database: {}", exc)
+
+
+def invalidate_schema(engine: Engine) -> None:
+    """Make the next ``init_db`` call for ``engine`` recreate missing tables, e.g. after a DROP."""
+    _INITIALIZED_ENGINES.discard(engine)
+
 
 def _apply_schema_patches(engine: Engine) -> None:
-    inspector = inspect(engine)
+    # Schema inspection only needs to happen once per engine; reset_engine builds a fresh one
+    if engine in _INITIALIZED_ENGINES:
+        return
 
-    def _has_column(table: str, column: str) -> bool:
-        try:
-            return any(col["name"] == column for col in inspector.get_columns(table))
-        except Exception:
-            # Table doesn't exist yet, will be created by create_all
-            return False
-    
-    def _table_exists(table: str) -> bool:
-        try:
-            return table in inspector.get_table_names()
-        except Exception:
-            return False
+    # Only needed on the first init per engine, so keep it off the import path
+    from sqlalchemy import inspect
 
     patches = [
         (
@@ -261,15 +495,51 @@ def _apply_schema_patches(engine: Engine) -> None:
         ),
     ]
 
+    is_sqlite = engine.url.get_backend_name() == "sqlite"
     with engine.begin() as connection:
+        # SQLite databases are stamped once fully patched, so later starts skip inspection
+        if is_sqlite and connection.exec_driver_sql("PRAGMA user_version").scalar() >= _SCHEMA_VERSION:
+            _INITIALIZED_ENGINES.add(engine)
+            return
+
+        # One metadata round-trip per distinct table instead of one per patch
+        try:
+            inspector = inspect(connection)
+            existing_tables = set(inspector.get_table_names())
+            columns = {
+                table: {col["name"] for col in inspector.get_columns(table)}
+                for table in {patch[0] for patch in patches} & existing_tables
+            }
+        except Exception as exc:
+            logger.warning("Failed to inspect schema for patches: {}", exc)
+            return
+
+        failed = False
         for table, column, ddl in patches:
-            if _table_exists(table) and not _has_column(table, column):
+            # Missing tables are created with every column by create_all
+            if table in columns and column not in columns[table]:
                 try:
                     connection.execute(text(ddl))
                     logger.info("Applied schema patch: added column %s.%s", table, column)
                 except Exception as exc:
+                    failed = True
                     logger.warning("Failed to apply schema patch for %s.%s: %s", table, column, exc)
 
+        # create_all skips existing tables, so indexes added to the models later are created here
+        for model_table in Base.metadata.sorted_tables:
+            for index in model_table.indexes:
+                try:
+                    index.create(connection, checkfirst=True)
+                except Exception as exc:
+                    failed = True
+                    logger.warning("Failed to create index {}: {}", index.name, exc)
+
+        # Leave unpatched databases unstamped so the failed steps are retried on the next start
+        if is_sqlite and not failed:
+            connection.exec_driver_sql(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    _INITIALIZED_ENGINES.add(engine)
+
 
 @contextmanager
 def session_scope() -> Iterator[Session]:
@@ -282,17 +552,7 @@ def session_scope() -> Iterator[Session]:
         OperationalError: If session creation or database operations fail
         SQLAlchemyError: For other database-related errors
     """
-    try:
-        session_factory = get_session_factory()
-    except (OperationalError, SQLAlchemyError) as exc:
-        logger.error("Failed to get session factory: %s", exc)
-        raise
-    except Exception as exc:
-        error_msg = format_connection_error(exc)
-        logger.exception("Unexpected error getting session factory: %s", exc)
-        raise OperationalError(error_msg, None, None) from exc
-    
-    session = session_factory()
+    session = _ensure_factory()()
     try:
         yield session
         session.commit()
@@ -314,3 +574,81 @@ def session_scope() -> Iterator[Session]:
     finally:
         session.close()
 
+
+@dataclass
+class BulkSession:
+    """Session wrapper yielded by ``bulk_session_scope`` that commits every ``batch_size`` rows."""
+
+    session: Session
+    batch_size: int
+    pending: int = 0
+
+    def mark(self, count: int = 1) -> None:
+        """Record ``count`` written rows, committing once ``batch_size`` have accumulated."""
+        self.pending += count
+        if self.pending >= self.batch_size:
+            self.commit()
+
+    def commit(self) -> None:
+        self.session.commit()
+        self.pending = 0
+
+
+@contextmanager
+def bulk_session_scope(batch_size: int = 1000) -> Iterator[BulkSession]:
+    """Context manager for large write loops that commits in chunks instead of per row.
+
+    Call ``mark()`` after each row; remaining rows are committed on exit. On error
+    only the uncommitted chunk is rolled back, so callers must tolerate partial progress.
+
+    Args:
+        batch_size: Number of marked rows per commit
+
+    Yields:
+        BulkSession: Wrapper exposing ``session`` and ``mark()``
+
+    Raises:
+        ValueError: If batch_size is not positive
+        OperationalError: If session creation or database operations fail
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+    bulk = BulkSession(session=_ensure_factory()(), batch_size=batch_size)
+    try:
+        yield bulk
+        bulk.commit()
+    except (OperationalError, SQLAlchemyError) as exc:
+        bulk.session.rollback()
+        logger.error("Bulk database operation failed, rolling back current chunk: {}", exc)
+        raise
+    except Exception:
+        bulk.session.rollback()
+        raise
+    finally:
+        bulk.session.close()
+
+
+@contextmanager
+def read_session_scope() -> Iterator[Session]:
+    """Context manager for read-only database sessions.
+
+    Sessions are bound to ``get_read_engine()`` and are never committed; use
+    ``session_scope`` for anything that writes.
+
+    Yields:
+        Session: SQLAlchemy session
+
+    Raises:
+        OperationalError: If session creation or database operations fail
+    """
+    engine = get_read_engine()
+    factory = _READ_SESSION_FACTORY if engine is _READ_ENGINE else _ensure_factory()
+    session = factory()
+    try:
+        yield session
+    except (OperationalError, SQLAlchemyError) as exc:
+        logger.error("Read-only database operation failed: {}", exc)
+        raise
+    finally:
+        session.close()
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func, JSON
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, desc, func, JSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -15,6 +15,11 @@ class Base(DeclarativeBase):
 
 class InputEmail(Base):
     __tablename__ = "input_emails"
+    __table_args__ = (
+        # Match the newest-first ordering of list_emails_by_batch / list_input_emails so no sort is needed
+        Index("ix_input_emails_batch_created", "pickle_batch_id", desc("created_at")),
+        Index("ix_input_emails_created", desc("created_at")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     email_hash: Mapped[str] = mapped_column(String(128), unique=True, index=True)
@@ -35,8 +40,9 @@ class InputEmail(Base):
     additional_contacts: Mapped[Optional[str]] = mapped_column(Text, default=None)
     model_confidence: Mapped[Optional[float]] = mapped_column(Float, default=None)
     message_id: Mapped[Optional[str]] = mapped_column(String(255), index=True, default=None)
-    image_base64: Mapped[Optional[str]] = mapped_column(Text, default=None)
-    body_html: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    # Large payloads are loaded on first access (or with undefer_group("content")) so list queries stay light
+    image_base64: Mapped[Optional[str]] = mapped_column(Text, default=None, deferred=True, deferred_group="content")
+    body_html: Mapped[Optional[str]] = mapped_column(Text, default=None, deferred=True, deferred_group="content")
     pickle_batch_id: Mapped[Optional[int]] = mapped_column(ForeignKey("pickle_batches.id"), index=True, default=None)
     knowledge_data: Mapped[Optional[dict]] = mapped_column(JSON, default=None)  # Stores knowledge enrichment data
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -97,7 +103,11 @@ class StandardEmail(Base):
 
 class Attachment(Base):
     __tablename__ = "attachments"
-    __table_args__ = (UniqueConstraint("input_email_id", "file_name", name="uq_attachment_email_filename"),)
+    __table_args__ = (
+        UniqueConstraint("input_email_id", "file_name", name="uq_attachment_email_filename"),
+        # Match the newest-first ordering of list_attachment_records so no sort is needed
+        Index("ix_attachments_created_email", desc("created_at"), "input_email_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     input_email_id: Mapped[int] = mapped_column(ForeignKey("input_emails.id", ondelete="CASCADE"))
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 
 from app.utils.error_handling import format_database_error
 from app.utils.validation import validate_batch_id, validate_email_hash, validate_email_id, validate_limit
 
 from .models import InputEmail, PickleBatch, StandardEmail
 
+__all__ = [
+    "bulk_upsert_input_emails",
+    "find_input_email_by_hash",
+    "find_standard_email_by_hash",
+    "get_input_email",
+    "get_pickle_batch",
+    "iter_emails_by_batch",
+    "list_emails_by_batch",
+    "list_input_email_hashes",
+    "list_input_emails",
+    "list_pickle_batches",
+    "list_standard_emails",
+    "register_pickle_batch",
+    "upsert_input_email",
+]
+
 
 def get_input_email(session: Session, email_id: int, eager_load_attachments: bool = False) -> Optional[InputEmail]:
-    """Get an input email by ID with validation.
+    """Get an input email by ID with validation, including its deferred body content.
     
     Args:
         session: Database session
@@ -34,15 +51,15 @@ def get_input_email(session: Session, email_id: int, eager_load_attachments: boo
         logger.warning("Invalid email_id in get_input_email: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        if eager_load_attachments:
-            stmt = select(InputEmail).options(joinedload(InputEmail.attachments)).where(InputEmail.id == email_id)
-            return session.execute(stmt).unique().scalar_one_or_none()
-        else:
-            return session.get(InputEmail, email_id)
-    except Exception as exc:
-        logger.error("Error retrieving input email %s: %s", email_id, exc)
-        raise
+    if eager_load_attachments:
+        stmt = (
+            select(InputEmail)
+            .options(joinedload(InputEmail.attachments), undefer_group("content"))
+            .where(InputEmail.id == email_id)
+        )
+        return session.execute(stmt).unique().scalar_one_or_none()
+    else:
+        return session.get(InputEmail, email_id, options=[undefer_group("content")])
 
 
 def find_input_email_by_hash(session: Session, email_hash: str) -> Optional[InputEmail]:
@@ -63,12 +80,23 @@ def find_input_email_by_hash(session: Session, email_hash: str) -> Optional[Inpu
         logger.warning("Invalid email_hash in find_input_email_by_hash: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        stmt = select(InputEmail).where(InputEmail.email_hash == email_hash)
-        return session.execute(stmt).scalar_one_or_none()
-    except Exception as exc:
-        logger.error("Error finding input email by hash %s: %s", email_hash[:16] + "...", exc)
-        raise
+    stmt = select(InputEmail).where(InputEmail.email_hash == email_hash)
+    return session.execute(stmt).scalar_one_or_none()
+
+
+def list_input_email_hashes(session: Session) -> set[str]:
+    """Return the hash of every stored input email.
+    
+    Served from the unique hash index in one query, so bulk callers can test membership
+    in memory instead of issuing one ``find_input_email_by_hash`` lookup per email.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Set of email hashes
+    """
+    return set(session.scalars(select(InputEmail.email_hash)))
 
 
 def list_input_emails(session: Session, limit: int = 100) -> Iterable[InputEmail]:
@@ -89,17 +117,67 @@ def list_input_emails(session: Session, limit: int = 100) -> Iterable[InputEmail
         logger.warning("Invalid limit in list_input_emails: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        stmt = select(InputEmail).order_by(InputEmail.created_at.desc()).limit(limit)
-        return session.scalars(stmt)
-    except Exception as exc:
-        logger.error("Error listing input emails: %s", exc)
-        raise
+    stmt = select(InputEmail).order_by(InputEmail.created_at.desc()).limit(limit)
+    return session.scalars(stmt)
+
+
+# Columns refreshed when an existing email (same ``email_hash``) is upserted again
+UPSERT_COLUMNS = (
+    "parse_status",
+    "parse_error",
+    "subject_id",
+    "sender",
+    "cc",
+    "subject",
+    "date_sent",
+    "date_reported",
+    "sending_source_raw",
+    "sending_source_parsed",
+    "url_raw",
+    "url_parsed",
+    "callback_number_raw",
+    "callback_number_parsed",
+    "additional_contacts",
+    "model_confidence",
+    "message_id",
+    "image_base64",
+    "body_html",
+    "knowledge_data",  # Include knowledge_data in updates
+)
+# What a fresh insert stores for a column the upserted email leaves unset
+_UPSERT_DEFAULTS = {
+    column: default.arg if (default := InputEmail.__table__.c[column].default) is not None else None
+    for column in UPSERT_COLUMNS
+}
+_INSERT_COLUMNS = tuple(attr.key for attr in InputEmail.__mapper__.column_attrs if attr.key != "id")
+
+
+def _supports_sqlite_upsert(session: Session) -> bool:
+    dialect = session.get_bind().dialect
+    return dialect.name == "sqlite" and dialect.insert_returning
+
+
+def _input_email_row(email: InputEmail) -> dict:
+    """Column values explicitly set on a (transient) InputEmail, so column defaults still apply."""
+    state = email.__dict__
+    return {column: state[column] for column in _INSERT_COLUMNS if column in state}
+
+
+def _input_email_upsert_statement():
+    stmt = sqlite_insert(InputEmail)
+    # ``excluded`` holds what the insert would have stored, defaults included, so columns the
+    # email leaves unset are reset exactly as the non-SQLite path resets them
+    update_set = {column: stmt.excluded[column] for column in UPSERT_COLUMNS}
+    update_set["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=[InputEmail.email_hash], set_=update_set)
 
 
 def upsert_input_email(session: Session, email: InputEmail) -> InputEmail:
     """Upsert an input email with validation and error handling.
     
+    On SQLite this is a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+    statement; the returned object is the persistent row, not ``email``.
+    
     Args:
         session: Database session
         email: InputEmail object to upsert
@@ -123,31 +201,23 @@ def upsert_input_email(session: Session, email: InputEmail) -> InputEmail:
         raise ValueError(error_msg)
     
     try:
+        if _supports_sqlite_upsert(session):
+            row = _input_email_row(email)
+            stmt = (
+                _input_email_upsert_statement()
+                .values(**row)
+                .returning(InputEmail)
+                .options(undefer_group("content"))
+                .execution_options(populate_existing=True)
+            )
+            return session.scalars(stmt).one()
+
         existing = find_input_email_by_hash(session, email.email_hash)
         if existing:
-            for attr in (
-                "parse_status",
-                "parse_error",
-                "subject_id",
-                "sender",
-                "cc",
-                "subject",
-                "date_sent",
-                "date_reported",
-                "sending_source_raw",
-                "sending_source_parsed",
-                "url_raw",
-                "url_parsed",
-                "callback_number_raw",
-                "callback_number_parsed",
-                "additional_contacts",
-                "model_confidence",
-                "message_id",
-                "image_base64",
-                "body_html",
-                "knowledge_data",  # Include knowledge_data in updates
-            ):
-                setattr(existing, attr, getattr(email, attr))
+            # Unset columns are reset too: a successful reparse clears parse_error, for example
+            row = _input_email_row(email)
+            for attr, default in _UPSERT_DEFAULTS.items():
+                setattr(existing, attr, row.get(attr, default))
             return existing
         session.add(email)
         return email
@@ -155,9 +225,43 @@ def upsert_input_email(session: Session, email: InputEmail) -> InputEmail:
         error_msg = format_database_error(exc, "upsert email")
         logger.error("Integrity error upserting email %s: %s", email.email_hash[:16] + "...", exc)
         raise IntegrityError(error_msg, None, None) from exc
-    except Exception as exc:
-        logger.error("Error upserting email %s: %s", email.email_hash[:16] + "...", exc)
-        raise
+
+
+def bulk_upsert_input_emails(session: Session, rows: List[dict]) -> None:
+    """Upsert many input emails in one executemany ``INSERT ... ON CONFLICT`` statement.
+    
+    Args:
+        session: Database session
+        rows: Column dictionaries keyed by InputEmail attribute name; every row must
+            provide ``email_hash`` and share the same keys
+        
+    Raises:
+        ValueError: If a row has an invalid email_hash or the rows have differing keys
+        IntegrityError: If database constraint violation occurs
+    """
+    if not rows:
+        return
+    
+    columns = set(rows[0])
+    for row in rows:
+        is_valid, error_msg = validate_email_hash(row.get("email_hash"))
+        if not is_valid:
+            logger.warning("Invalid email_hash in bulk_upsert_input_emails: %s", error_msg)
+            raise ValueError(error_msg)
+        if set(row) != columns:
+            raise ValueError("All rows must provide the same columns for a bulk upsert")
+    
+    if not _supports_sqlite_upsert(session):
+        for row in rows:
+            upsert_input_email(session, InputEmail(**row))
+        return
+    
+    try:
+        session.execute(_input_email_upsert_statement(), rows)
+    except IntegrityError as exc:
+        error_msg = format_database_error(exc, "bulk upsert emails")
+        logger.error("Integrity error bulk upserting %d emails: %s", len(rows), exc)
+        raise IntegrityError(error_msg, None, None) from exc
 
 
 def list_standard_emails(session: Session, limit: int = 100) -> Iterable[StandardEmail]:
@@ -178,12 +282,8 @@ def list_standard_emails(session: Session, limit: int = 100) -> Iterable[Standar
         logger.warning("Invalid limit in list_standard_emails: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        stmt = select(StandardEmail).order_by(StandardEmail.created_at.desc()).limit(limit)
-        return session.scalars(stmt)
-    except Exception as exc:
-        logger.error("Error listing standard emails: %s", exc)
-        raise
+    stmt = select(StandardEmail).order_by(StandardEmail.created_at.desc()).limit(limit)
+    return session.scalars(stmt)
 
 
 def find_standard_email_by_hash(session: Session, email_hash: str) -> Optional[StandardEmail]:
@@ -204,12 +304,8 @@ def find_standard_email_by_hash(session: Session, email_hash: str) -> Optional[S
         logger.warning("Invalid email_hash in find_standard_email_by_hash: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        stmt = select(StandardEmail).where(StandardEmail.email_hash == email_hash)
-        return session.execute(stmt).scalar_one_or_none()
-    except Exception as exc:
-        logger.error("Error finding standard email by hash %s: %s", email_hash[:16] + "...", exc)
-        raise
+    stmt = select(StandardEmail).where(StandardEmail.email_hash == email_hash)
+    return session.execute(stmt).scalar_one_or_none()
 
 
 def register_pickle_batch(session: Session, batch: PickleBatch) -> PickleBatch:
@@ -239,9 +335,6 @@ def register_pickle_batch(session: Session, batch: PickleBatch) -> PickleBatch:
         error_msg = format_database_error(exc, "register pickle batch")
         logger.error("Integrity error registering pickle batch %s: %s", batch.batch_name, exc)
         raise IntegrityError(error_msg, None, None) from exc
-    except Exception as exc:
-        logger.error("Error registering pickle batch %s: %s", batch.batch_name, exc)
-        raise
 
 
 def list_pickle_batches(session: Session, limit: int = 50) -> List[PickleBatch]:
@@ -262,12 +355,8 @@ def list_pickle_batches(session: Session, limit: int = 50) -> List[PickleBatch]:
         logger.warning("Invalid limit in list_pickle_batches: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        stmt = select(PickleBatch).order_by(PickleBatch.created_at.desc()).limit(limit)
-        return list(session.scalars(stmt))
-    except Exception as exc:
-        logger.error("Error listing pickle batches: %s", exc)
-        raise
+    stmt = select(PickleBatch).order_by(PickleBatch.created_at.desc()).limit(limit)
+    return list(session.scalars(stmt))
 
 
 def get_pickle_batch(session: Session, batch_id: int) -> Optional[PickleBatch]:
@@ -288,42 +377,98 @@ def get_pickle_batch(session: Session, batch_id: int) -> Optional[PickleBatch]:
         logger.warning("Invalid batch_id in get_pickle_batch: %s", error_msg)
         raise ValueError(error_msg)
     
-    try:
-        return session.get(PickleBatch, batch_id)
-    except Exception as exc:
-        logger.error("Error retrieving pickle batch %s: %s", batch_id, exc)
-        raise
+    return session.get(PickleBatch, batch_id)
 
 
-def list_emails_by_batch(session: Session, batch_id: int, eager_load_attachments: bool = False) -> List[InputEmail]:
+def _emails_by_batch_statement(batch_id: int, include_content: bool):
+    stmt = (
+        select(InputEmail)
+        .where(InputEmail.pickle_batch_id == batch_id)
+        .order_by(InputEmail.created_at.desc())
+    )
+    if include_content:
+        stmt = stmt.options(undefer_group("content"))
+    return stmt
+
+
+def list_emails_by_batch(
+    session: Session,
+    batch_id: int,
+    eager_load_attachments: bool = False,
+    include_content: bool = False,
+    *,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> List[InputEmail]:
     """List emails by batch ID with validation.
     
     Args:
         session: Database session
         batch_id: Batch ID to filter by
         eager_load_attachments: If True, eagerly load attachments relationship
+        include_content: If True, load the deferred body_html/image_base64 columns in the same query
+        offset: Number of emails to skip, newest first
+        limit: Maximum number of emails to return, or None for all
         
     Returns:
         List of InputEmail objects
         
     Raises:
-        ValueError: If batch_id is invalid
+        ValueError: If batch_id, offset or limit is invalid
     """
     is_valid, error_msg = validate_batch_id(batch_id)
     if not is_valid:
         logger.warning("Invalid batch_id in list_emails_by_batch: %s", error_msg)
         raise ValueError(error_msg)
+
+    is_valid, error_msg = validate_limit(limit, min_value=1, max_value=10000)
+    if not is_valid:
+        logger.warning("Invalid limit in list_emails_by_batch: %s", error_msg)
+        raise ValueError(error_msg)
+
+    if type(offset) is not int or offset < 0:
+        raise ValueError(f"Offset must be a non-negative integer, got {offset!r}")
     
-    try:
-        stmt = (
-            select(InputEmail)
-            .where(InputEmail.pickle_batch_id == batch_id)
-            .order_by(InputEmail.created_at.desc())
-        )
-        if eager_load_attachments:
-            stmt = stmt.options(joinedload(InputEmail.attachments))
-        return list(session.scalars(stmt).unique())
-    except Exception as exc:
-        logger.error("Error listing emails for batch %s: %s", batch_id, exc)
-        raise
+    stmt = _emails_by_batch_statement(batch_id, include_content)
+    if offset or limit is not None:
+        stmt = stmt.offset(offset).limit(limit)
+    if eager_load_attachments:
+        # One IN query for all attachments instead of repeating each email row per attachment
+        stmt = stmt.options(selectinload(InputEmail.attachments))
+    return list(session.scalars(stmt))
+
+
+def iter_emails_by_batch(
+    session: Session,
+    batch_id: int,
+    include_content: bool = False,
+    chunk_size: int = 500,
+) -> Iterator[InputEmail]:
+    """Stream emails for a batch, newest first, loading ``chunk_size`` rows at a time.
+    
+    Attachments are loaded per chunk with a single ``IN`` query, so callers can
+    serialize rows as they arrive instead of holding the whole batch in memory.
+    
+    Args:
+        session: Database session
+        batch_id: Batch ID to filter by
+        include_content: If True, load the deferred body_html/image_base64 columns in the same query
+        chunk_size: Number of rows fetched per round-trip
+        
+    Yields:
+        InputEmail objects with attachments loaded
+        
+    Raises:
+        ValueError: If batch_id is invalid
+    """
+    is_valid, error_msg = validate_batch_id(batch_id)
+    if not is_valid:
+        logger.warning("Invalid batch_id in iter_emails_by_batch: %s", error_msg)
+        raise ValueError(error_msg)
 
+    stmt = (
+        _emails_by_batch_statement(batch_id, include_content)
+        .options(selectinload(InputEmail.attachments))
+        .execution_options(yield_per=chunk_size)
+    )
+    yield from session.scalars(stmt)
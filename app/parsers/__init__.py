@@ -7,6 +7,7 @@ from .parser_email import (
     parse_email_file,
     parse_eml_bytes,
     parse_input_email,
+    parse_input_emails,
     parse_msg_file,
     parse_standard_email,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "ParsedAttachment",
     "parse_email_file",
     "parse_input_email",
+    "parse_input_emails",
     "parse_standard_email",
     "parse_eml_bytes",
     "parse_msg_file",
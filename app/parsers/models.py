@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from app.parsers.parser_phones import PhoneParseResult
+from app.parsers.parser_urls import URLParseResult
 
 
 class ParsedAttachment(BaseModel):
@@ -38,6 +41,9 @@ class ParsedEmail(BaseModel):
     body_html_clean: Optional[str] = None
     attachments: List[ParsedAttachment] = Field(default_factory=list)
     email_size: int = Field(..., ge=0)
+    # (source text, URL results, phone results) from parsing, so parse_standard_email
+    # does not scan the same body again
+    _extraction: Optional[Tuple[str, List[URLParseResult], List[PhoneParseResult]]] = PrivateAttr(default=None)
 
 
 class ParsedStandardEmail(BaseModel):
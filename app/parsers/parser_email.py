@@ -4,36 +4,74 @@ from __future__ import annotations
 
 import json
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from email import policy
 from email.message import EmailMessage, Message
-from email.parser import BytesParser
+from email.parser import BytesFeedParser, BytesParser
 from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple
 
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 
 try:
     import extract_msg
 except ImportError:  # pragma: no cover - optional dependency
     extract_msg = None  # type: ignore[assignment]
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore[assignment]
+    lxml_html = None  # type: ignore[assignment]
+
 from loguru import logger
 
 from app.parsers.models import ParsedAttachment, ParsedEmail, ParsedStandardEmail
 from app.parsers.parser_phones import extract_phone_numbers
-from app.parsers.parser_urls import extract_urls
+from app.parsers.parser_urls import URLParseResult, extract_urls
 
-BODY_FIELD_PATTERN = re.compile(
-    r"^\s*(?P<field>[A-Za-z _-]+):\s*(?P<value>.*)$",
-)
+# Characters allowed in a "Field Name:" label
+_FIELD_NAME_CHARS = string.ascii_letters + " _-"
 DATA_URI_PATTERN = re.compile(r"data:image/(?P<format>[a-zA-Z0-9.+-]+);base64,(?P<data>[A-Za-z0-9+/=]+)")
+_WS_NEWLINES_RE = re.compile(r"\n\s*\n\s*\n+")
+_TAG_STRIP_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Timestamp-like subjects: YYYY-MM-DDTHH:MM:SS+00:00, YYYY-MM-DDTHH:MM:SS, YYYYMMDDTHHMMSS, etc.
+_TIMESTAMP_RE = re.compile(
+    r"(\d{4})[-/]?(\d{2})[-/]?(\d{2})[T\s](\d{2})[:]?(\d{2})[:]?(\d{2})([+-]\d{2}[:]?\d{2})?"
+)
+_NON_DIGIT_T_RE = re.compile(r"[^\dTt]")
+
+# Plain strings: lxml's default "smart" strings keep a reference back to their parent
+# element, which makes collecting every text node of a large body several times slower
+_TEXT_NODES_XPATH = etree.XPath(".//text()", smart_strings=False) if etree is not None else None
+
+# lxml's C parser is much faster on large HTML bodies; fall back to the pure-Python
+# parser when lxml is not installed instead of raising FeatureNotFound per message
+HTML_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
+# Nothing reads ParsedEmail.body_html_clean today, so the extra parse and serialization
+# of every HTML body is skipped unless this is switched on
+PRETTIFY_HTML = False
+_EML_READ_CHUNK_SIZE = 1 << 16
 
 
 def _parse_date(value: str | None) -> Optional[datetime]:
     if not value:
         return None
+    # Header objects are str subclasses; key the cache on the plain string
+    return _parse_date_cached(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(value: str) -> Optional[datetime]:
+    # datetimes are immutable, so cached results are safe to hand out repeatedly
     try:
         return parsedate_to_datetime(value)
     except (TypeError, ValueError):
@@ -47,92 +85,155 @@ def _parse_date(value: str | None) -> Optional[datetime]:
             return None
 
 
-def _collect_body_text(message: EmailMessage) -> Tuple[Optional[str], Optional[str]]:
+def _walk_once(
+    message: Message,
+) -> Tuple[list[str], list[str], list[ParsedAttachment]]:
+    """Classify every MIME part in a single traversal, decoding each payload once.
+
+    Returns:
+        Tuple of (html_parts, text_parts, attachments)
+    """
     html_parts: list[str] = []
     text_parts: list[str] = []
+    attachments: list[ParsedAttachment] = []
+    multipart = message.is_multipart()
 
-    if message.is_multipart():
-        for part in message.walk():
-            disposition = part.get_content_disposition()
-            if disposition == "attachment":
-                continue
-            payload = part.get_payload(decode=True)
-            if payload is None:
+    for part in message.walk():
+        # Decoding is the expensive step, so each part's payload and type are read once
+        payload = part.get_payload(decode=True)
+        content_type = part.get_content_type()
+        if part.get_content_disposition() == "attachment":
+            attachments.append(_build_attachment(part, payload or b"", content_type))
+            if multipart:
                 continue
-            charset = part.get_content_charset("utf-8")
-            decoded = payload.decode(charset, errors="replace")
-            content_type = part.get_content_type()
-            if content_type == "text/html":
-                html_parts.append(decoded)
-            elif content_type == "text/plain":
-                text_parts.append(decoded)
-    else:
-        payload = message.get_payload(decode=True)
-        if payload:
-            decoded = payload.decode(message.get_content_charset("utf-8"), errors="replace")
-            if message.get_content_type() == "text/html":
-                html_parts.append(decoded)
-            else:
-                text_parts.append(decoded)
+        # A single-part message is its own body, even when flagged as an attachment
+        if payload is None or (not multipart and not payload):
+            continue
+        decoded = payload.decode(part.get_content_charset("utf-8"), errors="replace")
+        if content_type == "text/html":
+            html_parts.append(decoded)
+        elif content_type == "text/plain" or not multipart:
+            text_parts.append(decoded)
+
+    return html_parts, text_parts, attachments
 
+
+def _collect_body_text(html_parts: list[str], text_parts: list[str]) -> Tuple[Optional[str], Optional[str]]:
+    # Parts are joined after decoding on purpose: a byte-level join per charset would
+    # reorder mixed-charset bodies and b"\n" is not a newline in UTF-16/32 payloads
     html = "\n".join(html_parts) if html_parts else None
     if text_parts:
         text = "\n".join(text_parts)
     elif html:
         # Convert HTML to text as fallback
-        try:
-            text = BeautifulSoup(html, "html.parser").get_text(separator="\n", strip=True)
-        except Exception:  # noqa: BLE001 - fallback to simple tag stripping
-            import re
-            text = re.sub(r"<[^>]+>", " ", html)
-            text = re.sub(r"\s+", " ", text).strip()
+        text = None
+        if lxml_html is not None:
+            try:
+                text = _lxml_plain_text(html)
+            except (etree.LxmlError, ValueError):
+                text = None
+        if text is None:
+            try:
+                text = BeautifulSoup(html, HTML_PARSER).get_text(separator="\n", strip=True)
+            except Exception:  # noqa: BLE001 - fallback to simple tag stripping
+                text = _TAG_STRIP_RE.sub(" ", html)
+                text = _WHITESPACE_RE.sub(" ", text).strip()
     else:
         text = None
     return html, text
 
 
+def _lxml_text(element) -> str:
+    """Join an element's text nodes, stripped, like BeautifulSoup's ``get_text(strip=True)``."""
+    return "".join(part.strip() for part in _TEXT_NODES_XPATH(element))
+
+
+def _lxml_joined_text(tree) -> str:
+    """Text nodes joined by newlines, matching ``get_text(separator="\\n", strip=True)``."""
+    return "\n".join(part for part in (node.strip() for node in _TEXT_NODES_XPATH(tree)) if part)
+
+
+def _lxml_plain_text(html_content: str) -> str:
+    tree = lxml_html.fromstring(html_content)
+    # get_text() leaves out script, style and template strings
+    etree.strip_elements(tree, "script", "style", "template", with_tail=False)
+    return _lxml_joined_text(tree)
+
+
+def _lxml_html_to_text(html_content: str) -> str:
+    tree = lxml_html.fromstring(html_content)
+    etree.strip_elements(tree, "script", "style", with_tail=False)
+
+    # iter() plus an ancestor check rather than a "//table//tr" XPath: libxml2 merges the
+    # per-table node sets of that expression in quadratic time on large bodies
+    for row in tree.iter("tr"):
+        if next(row.iterancestors("table"), None) is None:
+            continue
+        cells = list(row.iter("td", "th"))
+        if len(cells) != 2:
+            continue
+        label = _lxml_text(cells[0])
+        value = _lxml_text(cells[1])
+        if label and value:
+            # Rewrite the row in place: etree.Element() would start a new document per row
+            row.clear(keep_tail=True)
+            row.tag = "div"
+            row.text = f"{label.rstrip(':')}: {value}"
+
+    return _lxml_joined_text(tree)
+
+
+def _soup_html_to_text(html_content: str) -> str:
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Special handling for HTML tables - convert to "Label: Value" format
+    for table in soup.find_all("table"):
+        for row in table.find_all("tr"):
+            cells = row.find_all(["td", "th"])
+            if len(cells) == 2:
+                # Convert two-column table rows to "Label: Value" format
+                label = cells[0].get_text(strip=True)
+                value = cells[1].get_text(strip=True)
+                if label and value:
+                    # Remove trailing colon from label if present, then add one
+                    label = label.rstrip(":")
+                    # Replace the table row with formatted text
+                    new_tag = soup.new_tag("div")
+                    new_tag.string = f"{label}: {value}"
+                    row.replace_with(new_tag)
+
+    return soup.get_text(separator="\n", strip=True)
+
+
 def _html_to_text(html_content: str | None) -> str | None:
     """Convert HTML content to plain text for field extraction.
     
     Handles HTML tables by converting table cells to "Label: Value" format
-    for better field extraction compatibility.
+    for better field extraction compatibility. Uses lxml directly when it is
+    installed and falls back to BeautifulSoup for input lxml rejects.
     """
     if not html_content:
         return None
-    try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Special handling for HTML tables - convert to "Label: Value" format
-        for table in soup.find_all("table"):
-            for row in table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
-                if len(cells) == 2:
-                    # Convert two-column table rows to "Label: Value" format
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    if label and value:
-                        # Remove trailing colon from label if present, then add one
-                        label = label.rstrip(":")
-                        # Replace the table row with formatted text
-                        new_tag = soup.new_tag("div")
-                        new_tag.string = f"{label}: {value}"
-                        row.replace_with(new_tag)
-        
-        # Get text and normalize whitespace
-        text = soup.get_text(separator="\n", strip=True)
-        # Clean up excessive whitespace while preserving line breaks
-        import re
-        text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)  # Max 2 consecutive newlines
-        return text
-    except Exception:  # noqa: BLE001 - fallback to original if parsing fails
-        # If BeautifulSoup fails, try simple regex to strip HTML tags
-        import re
-        text = re.sub(r"<[^>]+>", " ", html_content)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip() if text.strip() else None
+    text = None
+    if lxml_html is not None:
+        try:
+            text = _lxml_html_to_text(html_content)
+        except (etree.LxmlError, ValueError):
+            # Empty documents, or str input carrying an XML encoding declaration
+            text = None
+    if text is None:
+        try:
+            text = _soup_html_to_text(html_content)
+        except Exception:  # noqa: BLE001 - fallback to original if parsing fails
+            # If BeautifulSoup fails, try simple regex to strip HTML tags
+            text = _TAG_STRIP_RE.sub(" ", html_content)
+            text = _WHITESPACE_RE.sub(" ", text)
+            return text.strip() if text.strip() else None
+    # Clean up excessive whitespace while preserving line breaks
+    return _WS_NEWLINES_RE.sub("\n\n", text)  # Max 2 consecutive newlines
 
 
 def _extract_body_fields(body_text: str | None) -> dict[str, str]:
@@ -157,11 +258,12 @@ def _extract_body_fields(body_text: str | None) -> dict[str, str]:
         if not line:
             continue
         
-        # Match pattern: "Field Name: value" on the same line
-        match = BODY_FIELD_PATTERN.match(line)
-        if match:
-            field = match.group("field").strip().lower().replace(" ", "_")
-            value = match.group("value").strip()
+        # Match pattern: "Field Name: value" on the same line. The label is everything before
+        # the first colon; strip() empties it only if every character is a label character
+        label, colon, value = line.partition(":")
+        if colon and label and not label.strip(_FIELD_NAME_CHARS):
+            field = label.strip().lower().replace(" ", "_")
+            value = value.strip()
             # Normalize whitespace
             value = " ".join(value.split())
             # If value is empty/blank, set to "not available"
@@ -176,8 +278,13 @@ def _prettify_html(html_content: str | None) -> Optional[str]:
     """Safely prettify HTML content with error handling."""
     if not html_content:
         return None
+    if lxml_html is not None:
+        try:
+            return lxml_html.tostring(lxml_html.fromstring(html_content), pretty_print=True, encoding="unicode")
+        except (etree.LxmlError, ValueError):
+            pass  # fall back to BeautifulSoup below
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         return soup.prettify()
     except Exception:  # noqa: BLE001 - return original if prettify fails
         # If prettify fails, return original HTML
@@ -185,14 +292,32 @@ def _prettify_html(html_content: str | None) -> Optional[str]:
 
 
 def _extract_image_base64(body: str | None) -> Optional[str]:
-    if not body:
+    # Substring scan first: most bodies carry no inline image, so skip the regex entirely,
+    # and otherwise start matching at the first candidate instead of rescanning the prefix
+    start = body.find("data:image/") if body else -1
+    if start < 0:
         return None
-    match = DATA_URI_PATTERN.search(body)
+    match = DATA_URI_PATTERN.search(body, start)
     if match:
         return match.group("data")
     return None
 
 
+_EXTENSION_MIME_TYPES = {
+    "eml": "message/rfc822",
+    "msg": "application/vnd.ms-outlook",
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "pdf": "application/pdf",
+    "doc": "application/msword",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "xls": "application/vnd.ms-excel",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
 def _infer_attachment_mime_type(file_name: str, provided_mime_type: str | None) -> str:
     """Infer MIME type from filename if provided type is missing or generic.
     
@@ -202,48 +327,61 @@ def _infer_attachment_mime_type(file_name: str, provided_mime_type: str | None)
     if provided_mime_type and provided_mime_type not in ("application/octet-stream", "binary/octet-stream"):
         return provided_mime_type
     
-    # Infer from file extension
-    file_name_lower = file_name.lower()
-    if file_name_lower.endswith(".eml"):
-        return "message/rfc822"
-    elif file_name_lower.endswith(".msg"):
-        return "application/vnd.ms-outlook"
-    elif file_name_lower.endswith((".png",)):
-        return "image/png"
-    elif file_name_lower.endswith((".jpg", ".jpeg")):
-        return "image/jpeg"
-    elif file_name_lower.endswith(".gif"):
-        return "image/gif"
-    elif file_name_lower.endswith(".pdf"):
-        return "application/pdf"
-    elif file_name_lower.endswith((".doc", ".docx")):
-        return "application/msword" if file_name_lower.endswith(".doc") else "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    elif file_name_lower.endswith((".xls", ".xlsx")):
-        return "application/vnd.ms-excel" if file_name_lower.endswith(".xls") else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    # Infer from file extension; rpartition rather than splitext so a bare ".eml" still matches
+    _, dot, extension = file_name.rpartition(".")
+    if dot:
+        inferred = _EXTENSION_MIME_TYPES.get(extension.lower())
+        if inferred:
+            return inferred
     
     # Default fallback
     return provided_mime_type or "application/octet-stream"
 
 
-def _parse_attachments(message: EmailMessage | Message) -> list[ParsedAttachment]:
-    attachments: list[ParsedAttachment] = []
-    for part in message.walk():
-        disposition = part.get_content_disposition()
-        if disposition != "attachment":
-            continue
-        payload = part.get_payload(decode=True) or b""
-        file_name = part.get_filename() or "attachment"
-        content_type = _infer_attachment_mime_type(file_name, part.get_content_type())
-        attachments.append(
-            ParsedAttachment(
-                file_name=file_name,
-                content_type=content_type,
-                content_id=part.get("Content-ID"),
-                payload=payload,
-                size=len(payload),
-            )
-        )
-    return attachments
+def _header(message: Message, name: str) -> Optional[str]:
+    """Return a header decoded as ``policy.default`` would, as a plain ``str``.
+
+    EML files are parsed with ``policy.compat32``, which keeps raw header values instead
+    of building a header object for every header of every part; only the few headers the
+    parsers read go through the modern header parser here.
+    """
+    value = _raw_header(message, name)
+    return None if value is None else str(policy.default.header_fetch_parse(name, value))
+
+
+def _raw_header(message: Message, name: str) -> Optional[str]:
+    """Return the first ``name`` header exactly as stored on the message, or None."""
+    name = name.lower()
+    for key, value in message.raw_items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _attachment_filename(part: Message) -> Optional[str]:
+    """Return the part's filename with RFC 2047 encoded-words decoded like ``policy.default``."""
+    file_name = part.get_filename()
+    if not file_name or "=?" not in file_name:
+        return file_name
+    # compat32 leaves encoded-words in parameters; mirror get_filename() on the parsed headers
+    for header_name, param in (("Content-Disposition", "filename"), ("Content-Type", "name")):
+        value = _raw_header(part, header_name)
+        if value is not None:
+            decoded = policy.default.header_fetch_parse(header_name, value).params.get(param)
+            if decoded is not None:
+                return decoded
+    return None
+
+
+def _build_attachment(part: Message, payload: bytes, content_type: str) -> ParsedAttachment:
+    file_name = _attachment_filename(part) or "attachment"
+    return ParsedAttachment.model_construct(
+        file_name=file_name,
+        content_type=_infer_attachment_mime_type(file_name, content_type),
+        content_id=_header(part, "Content-ID"),
+        payload=payload,
+        size=len(payload),
+    )
 
 
 def _build_subject_id(date_reported: Optional[datetime]) -> Optional[str]:
@@ -273,15 +411,7 @@ def _clean_timestamp_from_subject(subject: str | None) -> Optional[str]:
     if not subject:
         return None
     
-    import re
-    
-    # Pattern to match timestamp-like format: 2025-01-15T12:30:00+00:00 or variations
-    # Matches: YYYY-MM-DDTHH:MM:SS+00:00, YYYY-MM-DDTHH:MM:SS, YYYYMMDDTHHMMSS, etc.
-    timestamp_pattern = re.compile(
-        r'(\d{4})[-/]?(\d{2})[-/]?(\d{2})[T\s](\d{2})[:]?(\d{2})[:]?(\d{2})([+-]\d{2}[:]?\d{2})?'
-    )
-    
-    match = timestamp_pattern.search(subject)
+    match = _TIMESTAMP_RE.search(subject)
     if match:
         # Extract components from matched pattern
         year = match.group(1)
@@ -305,9 +435,9 @@ def _clean_timestamp_from_subject(subject: str | None) -> Optional[str]:
         return timestamp
     
     # If regex pattern didn't match, try simpler pattern for date-only or compact format
-    # Try simpler pattern for date-only or compact format
     # Remove all non-digit and non-T characters, check if it looks like timestamp
-    cleaned = re.sub(r'[^\dT]', '', subject.upper())
+    # Strip first and upper-case only what is left, rather than copying the whole subject
+    cleaned = _NON_DIGIT_T_RE.sub('', subject).upper()
     
     # Check if it has at least 8 digits (date) and looks timestamp-like
     digits_only = cleaned.replace('T', '')
@@ -326,59 +456,75 @@ def _clean_timestamp_from_subject(subject: str | None) -> Optional[str]:
         cleaned = cleaned[:-4]
     
     # Validate format: should be YYYYMMDDTHHMMSS or YYYYMMDDTHHMM
+    # (cleaned always carries a T here, so a bare YYYYMMDD cannot reach this point)
     if len(cleaned) == 15:  # YYYYMMDDTHHMMSS
         return cleaned
     elif len(cleaned) == 13:  # YYYYMMDDTHHMM
         return cleaned + "00"  # Add seconds
     elif len(cleaned) == 11:  # YYYYMMDDTHH (just hours)
         return cleaned + "0000"  # Add minutes and seconds
-    elif len(cleaned) == 8:  # YYYYMMDD only
-        return cleaned + "T000000"  # Add default time
     else:
         return None
 
 
 def _dedupe(values: list[str]) -> list[str]:
-    seen = set()
-    ordered: list[str] = []
-    for value in values:
-        if value not in seen:
-            ordered.append(value)
-            seen.add(value)
-    return ordered
-
-
-def _parse_email_message(message: EmailMessage, size_hint: int) -> ParsedEmail:
-    html_body, text_body = _collect_body_text(message)
+    # dicts keep insertion order, so this is an order-preserving dedupe
+    return list(dict.fromkeys(values))
+
+
+def _dedupe_urls(urls: list[URLParseResult]) -> Tuple[list[str], list[str]]:
+    """Build the ordered, de-duplicated raw URLs and parsed domains in one pass."""
+    seen_raw: set[str] = set()
+    seen_parsed: set[str] = set()
+    urls_raw: list[str] = []
+    urls_parsed: list[str] = []
+    for item in urls:
+        if item.original not in seen_raw:
+            urls_raw.append(item.original)
+            seen_raw.add(item.original)
+        if item.domain not in seen_parsed:
+            urls_parsed.append(item.domain)
+            seen_parsed.add(item.domain)
+    return urls_raw, urls_parsed
+
+
+def _parse_email_message(message: Message, size_hint: int) -> ParsedEmail:
+    html_parts, text_parts, attachments = _walk_once(message)
+    html_body, text_body = _collect_body_text(html_parts, text_parts)
     body_fields = _extract_body_fields(text_body or html_body)
 
-    urls = extract_urls(text_body or html_body or "")
-    phones = extract_phone_numbers(text_body or html_body or "")
+    extraction_text = text_body or html_body or ""
+    urls = extract_urls(extraction_text)
+    urls_raw, urls_parsed = _dedupe_urls(urls)
+    phones = extract_phone_numbers(extraction_text)
 
     sending_source_raw = body_fields.get("sending_source")
     additional_contacts = body_fields.get("additional_contacts")
     callback_number_raw = body_fields.get("callback_number")
-
-    parsed = ParsedEmail(
-        sender=message.get("From"),
-        cc=_dedupe([addr.strip() for addr in (message.get("Cc") or "").split(",") if addr.strip()]),
-        subject=message.get("Subject"),
-        date_sent=_parse_date(message.get("Date")),
+    model_confidence = body_fields.get("model_confidence")
+
+    # Every value below comes from the MIME decoder or our own extractors, so skip
+    # validation; anything building ParsedEmail from outside data must use ParsedEmail(...)
+    parsed = ParsedEmail.model_construct(
+        sender=_header(message, "From"),
+        cc=_dedupe([addr.strip() for addr in (_header(message, "Cc") or "").split(",") if addr.strip()]),
+        subject=_header(message, "Subject"),
+        date_sent=_parse_date(_header(message, "Date")),
         body_html=html_body,
         body_text=text_body,
         date_reported=_parse_date(body_fields.get("date_reported")),
         sending_source_raw=sending_source_raw,
         sending_source_parsed=_dedupe([result.domain for result in extract_urls(sending_source_raw or "")]),
-        urls_raw=_dedupe([item.original for item in urls]),
-        urls_parsed=_dedupe([item.domain for item in urls]),
+        urls_raw=urls_raw,
+        urls_parsed=urls_parsed,
         callback_numbers_raw=[callback_number_raw] if callback_number_raw else [],
         callback_numbers_parsed=[item.e164 for item in phones],
         additional_contacts=additional_contacts,
-        model_confidence=float(body_fields["model_confidence"]) if body_fields.get("model_confidence") else None,
-        message_id=message.get("Message-ID"),
+        model_confidence=float(model_confidence) if model_confidence else None,
+        message_id=_header(message, "Message-ID"),
         image_base64=_extract_image_base64(html_body),
-        body_html_clean=_prettify_html(html_body),
-        attachments=_parse_attachments(message),
+        body_html_clean=_prettify_html(html_body) if PRETTIFY_HTML else None,
+        attachments=attachments,
         email_size=size_hint,
     )
     # Subject ID priority:
@@ -398,14 +544,73 @@ def _parse_email_message(message: EmailMessage, size_hint: int) -> ParsedEmail:
         subject_id = body_fields.get("subject")
     
     parsed.subject_id = subject_id
+    parsed._extraction = (extraction_text, urls, phones)
     return parsed
 
 
 def parse_eml_bytes(data: bytes) -> ParsedEmail:
-    message = BytesParser(policy=policy.default).parsebytes(data)
+    # compat32 skips header-object construction during the parse; _header decodes the
+    # handful of headers we read the same way policy.default would
+    message = BytesParser(policy=policy.compat32).parsebytes(data)
     return _parse_email_message(message, size_hint=len(data))
 
 
+def _parse_eml_file(path: Path) -> ParsedEmail:
+    # Feed the file in chunks rather than reading it into one bytes object: parsebytes()
+    # holds the raw bytes and a full decoded copy at once, roughly tripling peak memory on
+    # large messages. BytesParser.parse() would stream too, but its text wrapper
+    # translates CRLF line endings and so alters 8bit bodies.
+    parser = BytesFeedParser(policy=policy.compat32)
+    size = 0
+    with path.open("rb") as handle:
+        for chunk in iter(partial(handle.read, _EML_READ_CHUNK_SIZE), b""):
+            size += len(chunk)
+            parser.feed(chunk)
+    return _parse_email_message(parser.close(), size_hint=size)
+
+
+def _msg_attachment_payload(msg, att, file_name: str):
+    """Return an MSG attachment's data, touching the filesystem only as a last resort.
+
+    extract_msg may store the data in different attributes or require saving to disk
+    first. Returns bytes, str or None.
+    """
+    # Methods 1 and 2: direct data or binary attribute
+    for attr in ("data", "binary"):
+        value = getattr(att, attr, None)
+        if not value:
+            continue
+        # Embedded MSG attachments hold the nested message object rather than bytes
+        export_bytes = getattr(value, "exportBytes", None)
+        if callable(export_bytes):
+            try:
+                return export_bytes()
+            except Exception as exc:  # noqa: BLE001 - fall through to the next method
+                logger.debug("Failed to export embedded message '%s' in memory: %s", file_name, exc)
+                continue
+        return value
+
+    # Method 3: Try to save and read (extract_msg may require this for some attachments)
+    try:
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir) / file_name
+            # Try to save attachment to temp file
+            if hasattr(att, "save"):
+                att.save(tmp_path)
+                if tmp_path.exists():
+                    return tmp_path.read_bytes()
+            # Alternative: try to get data after saving
+            elif hasattr(msg, "saveAttachments"):
+                msg.saveAttachments(tmpdir)
+                saved_path = Path(tmpdir) / file_name
+                if saved_path.exists():
+                    return saved_path.read_bytes()
+    except Exception as exc:
+        logger.debug("Failed to extract attachment '%s' via save method: %s", file_name, exc)
+    return None
+
+
 def parse_msg_file(path: Path) -> ParsedEmail:
     if extract_msg is None:
         raise RuntimeError(
@@ -436,9 +641,15 @@ def parse_msg_file(path: Path) -> ParsedEmail:
     elif text_body:
         body_text_for_fields = text_body
 
-    urls = extract_urls(text_body or html_body or "")
-    phones = extract_phone_numbers(text_body or html_body or "")
+    extraction_text = text_body or html_body or ""
+    urls = extract_urls(extraction_text)
+    urls_raw, urls_parsed = _dedupe_urls(urls)
+    phones = extract_phone_numbers(extraction_text)
     body_fields = _extract_body_fields(body_text_for_fields)
+    sending_source_raw = body_fields.get("sending_source")
+    additional_contacts = body_fields.get("additional_contacts")
+    callback_number_raw = body_fields.get("callback_number")
+    model_confidence = body_fields.get("model_confidence")
 
     attachments: list[ParsedAttachment] = []
     for att in msg.attachments:
@@ -448,35 +659,7 @@ def parse_msg_file(path: Path) -> ParsedEmail:
         # Infer MIME type from filename if missing or generic (important for EML attachments)
         content_type = _infer_attachment_mime_type(file_name, original_mime_type)
         
-        # Try multiple ways to get attachment data
-        # extract_msg may store it in different attributes or require saving to disk first
-        payload = None
-        
-        # Method 1: Direct data attribute
-        if hasattr(att, "data") and att.data:
-            payload = att.data
-        # Method 2: Binary attribute
-        elif hasattr(att, "binary") and att.binary:
-            payload = att.binary
-        # Method 3: Try to save and read (extract_msg may require this for some attachments)
-        else:
-            try:
-                import tempfile
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    tmp_path = Path(tmpdir) / file_name
-                    # Try to save attachment to temp file
-                    if hasattr(att, "save"):
-                        att.save(tmp_path)
-                        if tmp_path.exists():
-                            payload = tmp_path.read_bytes()
-                    # Alternative: try to get data after saving
-                    elif hasattr(msg, "saveAttachments"):
-                        msg.saveAttachments(tmpdir)
-                        saved_path = Path(tmpdir) / file_name
-                        if saved_path.exists():
-                            payload = saved_path.read_bytes()
-            except Exception as exc:
-                logger.debug("Failed to extract attachment '%s' via save method: %s", file_name, exc)
+        payload = _msg_attachment_payload(msg, att, file_name)
         
         # Convert string to bytes if needed
         if isinstance(payload, str):
@@ -493,7 +676,7 @@ def parse_msg_file(path: Path) -> ParsedEmail:
             )
         
         attachments.append(
-            ParsedAttachment(
+            ParsedAttachment.model_construct(
                 file_name=file_name,
                 content_type=content_type,
                 content_id=None,
@@ -502,32 +685,33 @@ def parse_msg_file(path: Path) -> ParsedEmail:
             )
         )
 
-    # Use converted HTML text for body_text if no text_body is available
+    # Use converted HTML text for body_text if no text_body is available; the HTML
+    # was already converted for field extraction above, so reuse that result
     final_body_text = text_body
     if not final_body_text and html_body:
-        final_body_text = _html_to_text(html_body)
+        final_body_text = body_text_for_fields
     
-    parsed = ParsedEmail(
-        sender=message.get("From"),
-        cc=_dedupe([addr.strip() for addr in (message.get("Cc") or "").split(",") if addr.strip()]),
-        subject=message.get("Subject"),
-        date_sent=_parse_date(message.get("Date")),
+    # Every value below comes from the MIME decoder or our own extractors, so skip
+    # validation; anything building ParsedEmail from outside data must use ParsedEmail(...)
+    parsed = ParsedEmail.model_construct(
+        sender=_header(message, "From"),
+        cc=_dedupe([addr.strip() for addr in (_header(message, "Cc") or "").split(",") if addr.strip()]),
+        subject=_header(message, "Subject"),
+        date_sent=_parse_date(_header(message, "Date")),
         body_html=html_body,
         body_text=final_body_text,
         date_reported=_parse_date(body_fields.get("date_reported")),
-        sending_source_raw=body_fields.get("sending_source"),
-        sending_source_parsed=_dedupe(
-            [result.domain for result in extract_urls(body_fields.get("sending_source", ""))]
-        ),
-        urls_raw=_dedupe([item.original for item in urls]),
-        urls_parsed=_dedupe([item.domain for item in urls]),
-        callback_numbers_raw=[body_fields.get("callback_number")] if body_fields.get("callback_number") else [],
+        sending_source_raw=sending_source_raw,
+        sending_source_parsed=_dedupe([result.domain for result in extract_urls(sending_source_raw or "")]),
+        urls_raw=urls_raw,
+        urls_parsed=urls_parsed,
+        callback_numbers_raw=[callback_number_raw] if callback_number_raw else [],
         callback_numbers_parsed=[item.e164 for item in phones],
-        additional_contacts=body_fields.get("additional_contacts"),
-        model_confidence=float(body_fields["model_confidence"]) if body_fields.get("model_confidence") else None,
-        message_id=message.get("Message-ID"),
+        additional_contacts=additional_contacts,
+        model_confidence=float(model_confidence) if model_confidence else None,
+        message_id=_header(message, "Message-ID"),
         image_base64=_extract_image_base64(html_body),
-        body_html_clean=_prettify_html(html_body),
+        body_html_clean=_prettify_html(html_body) if PRETTIFY_HTML else None,
         attachments=attachments,
         email_size=path.stat().st_size,
     )
@@ -548,20 +732,47 @@ def parse_msg_file(path: Path) -> ParsedEmail:
         subject_id = body_fields.get("subject")
     
     parsed.subject_id = subject_id
+    parsed._extraction = (extraction_text, urls, phones)
     return parsed
 
 
 def parse_input_email(path: Path, data: bytes | None = None) -> ParsedEmail:
     if path.suffix.lower() == ".msg":
         return parse_msg_file(path)
-    payload = data if data is not None else path.read_bytes()
-    return parse_eml_bytes(payload)
+    if data is not None:
+        return parse_eml_bytes(data)
+    return _parse_eml_file(path)
+
+
+def parse_input_emails(paths: Iterable[Path], workers: Optional[int] = None) -> Iterator[ParsedEmail]:
+    """Parse many email files across a pool of worker processes.
+
+    Parsing is CPU-bound and holds the GIL, so threads would not help. Results are
+    yielded in the order of ``paths``; a file that fails to parse raises its
+    exception when its result is reached.
+
+    Args:
+        paths: Email files to parse (.eml or .msg)
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Yields:
+        ParsedEmail for each path, in input order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_input_email, paths, chunksize=16)
 
 
 def parse_standard_email(path: Path, data: bytes | None = None) -> ParsedStandardEmail:
     parsed = parse_input_email(path, data)
-    urls = extract_urls(parsed.body_text or parsed.body_html or "")
-    phones = extract_phone_numbers(parsed.body_text or parsed.body_html or "")
+    text = parsed.body_text or parsed.body_html or ""
+    # Reuse the parser's extractor results when they were computed from the same text;
+    # MSG files without a plain-text body were scanned as raw HTML instead
+    extraction = parsed._extraction
+    if extraction is not None and extraction[0] == text:
+        _, urls, phones = extraction
+    else:
+        urls = extract_urls(text)
+        phones = extract_phone_numbers(text)
     return ParsedStandardEmail(
         to_address=None,  # not provided in raw models
         from_address=parsed.sender,
@@ -9,6 +9,14 @@ from typing import List, Set
 import phonenumbers
 from phonenumbers.phonenumberutil import NumberParseException
 
+from .parser_urls import MAX_BODY_SCAN
+
+_HAS_DIGIT_PATTERN = re.compile(r"\d")
+_FALLBACK_PHONE_PATTERN = re.compile(r"(?:\+?\d[\d\s().-]{6,}\d)")
+# Deletes every non-decimal character a fallback candidate can hold ("+().-" and \s, whose
+# highest code point is U+3000); translate() is cheaper than re.sub(r"\D") on short strings
+_NON_DIGIT_TABLE = dict.fromkeys(c for c in range(0x3001) if not chr(c).isdecimal())
+
 
 @dataclass(frozen=True)
 class PhoneParseResult:
@@ -18,8 +26,10 @@ class PhoneParseResult:
 
 
 def extract_phone_numbers(text: str | None, default_region: str = "US") -> List[PhoneParseResult]:
-    if not text:
+    # Building a PhoneNumberMatcher is costly; text without any digit cannot hold a number
+    if not text or not _HAS_DIGIT_PATTERN.search(text):
         return []
+    text = text[:MAX_BODY_SCAN]
 
     seen: Set[str] = set()
     results: List[PhoneParseResult] = []
@@ -40,10 +50,9 @@ def extract_phone_numbers(text: str | None, default_region: str = "US") -> List[
         region_code = phonenumbers.region_code_for_number(number)
         results.append(PhoneParseResult(original=candidate, e164=e164, region_code=region_code))
 
-    fallback_pattern = re.compile(r"(?:\+?\d[\d\s().-]{6,}\d)")
-    for match in fallback_pattern.finditer(text):
+    for match in _FALLBACK_PHONE_PATTERN.finditer(text):
         candidate = match.group()
-        digits = re.sub(r"\D", "", candidate)
+        digits = candidate.translate(_NON_DIGIT_TABLE)
         if len(digits) == 10:
             e164 = f"+1{digits}"
         elif len(digits) == 11 and digits.startswith("1"):
@@ -59,3 +68,16 @@ def extract_phone_numbers(text: str | None, default_region: str = "US") -> List[
 
     return results
 
+
+def _warmup() -> None:
+    # phonenumbers loads region metadata and compiles its matcher patterns lazily on first
+    # use; pay that once at import (also in each worker process) instead of on the first email
+    try:
+        for _ in phonenumbers.PhoneNumberMatcher("+1 555-555-0100", "US"):
+            pass
+        phonenumbers.region_code_for_number(phonenumbers.parse("+15555550100", "US"))
+    except Exception:  # noqa: BLE001
+        pass
+
+
+_warmup()
@@ -4,29 +4,37 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Set
+from functools import lru_cache
+from typing import Dict, List
 
 import tldextract
 
-# Pattern to match fanged URLs (hxxp://, hxxps://, example[.]com, example(.)com)
-FANGED_URL_PATTERN = re.compile(
-    r"(?P<url>(?:hxxps?://|hxxp://|ftp://|www\.)[^\s<>\"]+)",
-    flags=re.IGNORECASE,
-)
-
-# Pattern for standard URLs
+# Standard (http://, https://, ftp://, www.) and fanged (hxxp://, hxxps://) URLs in one scan
 URL_PATTERN = re.compile(
-    r"(?P<url>(?:https?://|ftp://|www\.)[^\s<>\"]+)",
+    r"(?P<fanged>hxxps?://[^\s<>\"]+)|(?P<url>(?:https?://|ftp://|www\.)[^\s<>\"]+)",
     flags=re.IGNORECASE,
 )
 
 # Pattern to match fanged domains (example[.]com, example(.)com, example{.}com)
-# This matches domains where dots are replaced with brackets
+# This matches domains where dots are replaced with brackets. The lookbehind pins a match
+# to the start of a label: without it every offset inside a long alphanumeric run (base64,
+# hex blobs) retried the 63-char label, which took seconds per megabyte of such text.
 FANGED_DOMAIN_PATTERN = re.compile(
-    r"(?P<domain>[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\[\.\]|\(\.\)|\{\.\}|\[dot\]|\(dot\)|\{dot\})[a-z]{2,}(?:(?:\[\.\]|\(\.\)|\{\.\}|\[dot\]|\(dot\)|\{dot\})[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*)",
+    r"(?<![a-z0-9])(?P<domain>[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?(?:\[\.\]|\(\.\)|\{\.\}|\[dot\]|\(dot\)|\{dot\})[a-z]{2,}(?:(?:\[\.\]|\(\.\)|\{\.\}|\[dot\]|\(dot\)|\{dot\})[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*)",
     flags=re.IGNORECASE,
 )
 
+# Bundled public-suffix snapshot only: the default extractor may fetch the list over the
+# network and reads/writes an on-disk cache, neither of which this local-only app needs
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+# Only the first MAX_BODY_SCAN characters of a text are scanned, bounding latency on huge bodies;
+# extract_phone_numbers shares the limit
+MAX_BODY_SCAN = 2_000_000
+
+_FANGED_SCHEME_PATTERN = re.compile(r"^hxxps?://", flags=re.IGNORECASE)
+_FANGED_DOT_PATTERN = re.compile(r"\[\.\]|\(\.\)|\{\.\}|\[dot\]|\(dot\)|\{dot\}", flags=re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class URLParseResult:
@@ -47,17 +55,10 @@ def _defang_url(url: str) -> str:
     - example[dot]com -> example.com
     """
     # Replace fanged protocols
-    url = re.sub(r"^hxxps?://", lambda m: m.group(0).replace("hxxp", "http"), url, flags=re.IGNORECASE)
-    
-    # Replace fanged dots in domain
-    url = re.sub(r"\[\.\]", ".", url, flags=re.IGNORECASE)
-    url = re.sub(r"\(\.\)", ".", url, flags=re.IGNORECASE)
-    url = re.sub(r"\{\.\}", ".", url, flags=re.IGNORECASE)
-    url = re.sub(r"\[dot\]", ".", url, flags=re.IGNORECASE)
-    url = re.sub(r"\(dot\)", ".", url, flags=re.IGNORECASE)
-    url = re.sub(r"\{dot\}", ".", url, flags=re.IGNORECASE)
+    url = _FANGED_SCHEME_PATTERN.sub(lambda m: m.group(0).replace("hxxp", "http"), url)
     
-    return url
+    # Replace fanged dots in domain, all variants in a single pass
+    return _FANGED_DOT_PATTERN.sub(".", url)
 
 
 def _normalize(url: str) -> str:
@@ -70,8 +71,10 @@ def _normalize(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=8192)
 def _extract_domain(url: str) -> str:
-    extracted = tldextract.extract(url)
+    # Pure function of the URL, and the same links recur across a batch of reports
+    extracted = _TLD_EXTRACT(url)
     domain = extracted.top_domain_under_public_suffix or ""
     return domain.lower()
 
@@ -84,51 +87,33 @@ def extract_urls(text: str | None) -> List[URLParseResult]:
     """
     if not text:
         return []
+    text = text[:MAX_BODY_SCAN]
 
-    seen: Set[str] = set()
-    results: List[URLParseResult] = []
+    # Keyed by lower-cased normalized URL; dicts keep insertion order
+    results: Dict[str, URLParseResult] = {}
 
-    # First, extract standard URLs
-    for match in URL_PATTERN.finditer(text):
-        raw_url = match.group("url")
-        normalized = _normalize(raw_url)
-        domain = _extract_domain(normalized)
-        if not domain:
-            continue
+    def _add(raw: str, normalized: str) -> None:
         key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        results.append(URLParseResult(original=raw_url, normalized=normalized, domain=domain))
+        if key in results:
+            return
+        domain = _extract_domain(normalized)
+        if domain:
+            results[key] = URLParseResult(original=raw, normalized=normalized, domain=domain)
 
-    # Then, extract fanged URLs
-    for match in FANGED_URL_PATTERN.finditer(text):
+    # One scan for both URL kinds; fanged URLs are still added after the standard ones
+    fanged_urls: List[str] = []
+    for match in URL_PATTERN.finditer(text):
         raw_url = match.group("url")
-        normalized = _normalize(raw_url)  # This will defang it
-        domain = _extract_domain(normalized)
-        if not domain:
-            continue
-        key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        results.append(URLParseResult(original=raw_url, normalized=normalized, domain=domain))
+        if raw_url is None:
+            fanged_urls.append(match.group("fanged"))
+        else:
+            _add(raw_url, _normalize(raw_url))
+    for raw_url in fanged_urls:
+        _add(raw_url, _normalize(raw_url))  # _normalize defangs
 
     # Also look for standalone fanged domains (without protocol)
     for match in FANGED_DOMAIN_PATTERN.finditer(text):
         raw_domain = match.group("domain")
-        # Defang the domain
-        defanged = _defang_url(raw_domain)
-        # Create a normalized URL
-        normalized = f"https://{defanged}"
-        domain = _extract_domain(normalized)
-        if not domain:
-            continue
-        key = normalized.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        results.append(URLParseResult(original=raw_domain, normalized=normalized, domain=domain))
-
-    return results
+        _add(raw_domain, f"https://{_defang_url(raw_domain)}")
 
+    return list(results.values())
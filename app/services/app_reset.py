@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import sqlite3
+import time
+from contextlib import closing
 from pathlib import Path
 from typing import Iterable
 
@@ -12,16 +16,23 @@ from app.config import AppConfig
 
 
 def _clear_directory_contents(path: Path) -> None:
-    if not path.exists():
+    # scandir's DirEntry carries the file type, so no Path objects or extra stat calls per entry
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
         return
-    for item in path.iterdir():
-        try:
-            if item.is_dir():
-                shutil.rmtree(item, ignore_errors=True)
-            else:
-                item.unlink(missing_ok=True)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to remove %s: %s", item, exc)
+    with entries:
+        for entry in entries:
+            try:
+                # Symlinks are unlinked rather than followed into their targets
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                continue
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to remove %s: %s", entry.path, exc)
 
 
 def _sqlite_path(config: AppConfig) -> Path | None:
@@ -48,6 +59,15 @@ def backup_database(config: AppConfig, destination: Path) -> Path | None:
     return destination
 
 
+def _checkpoint_wal(db_path: Path) -> None:
+    """Checkpoint and truncate the WAL so no connection keeps the sidecar files open."""
+    try:
+        with closing(sqlite3.connect(db_path, timeout=1.0)) as connection:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error as exc:
+        logger.debug("WAL checkpoint before reset failed for %s: %s", db_path, exc)
+
+
 def reset_application(
     config: AppConfig,
     *,
@@ -66,43 +86,39 @@ def reset_application(
         logger.info("Attempting to delete database at: %s (exists: %s)", db_path, db_path.exists())
         
         if db_path.exists():
-            # Try multiple times to delete the database file
-            # SQLite may hold locks briefly after connections close
-            import time
-            max_attempts = 5
-            deleted = False
+            # Fold the WAL back into the main file so the -wal/-shm files are released
+            # deterministically instead of waiting for SQLite to drop its locks
+            _checkpoint_wal(db_path)
+            wal_path = db_path.with_suffix(db_path.suffix + "-wal")
+            shm_path = db_path.with_suffix(db_path.suffix + "-shm")
+            max_attempts = 3
             for attempt in range(max_attempts):
                 try:
-                    # Also delete SQLite WAL and SHM files if they exist
-                    wal_path = db_path.with_suffix(db_path.suffix + "-wal")
-                    shm_path = db_path.with_suffix(db_path.suffix + "-shm")
-                    
                     logger.debug("Attempt %d/%d: Deleting database files", attempt + 1, max_attempts)
-                    
+
                     # Delete WAL and SHM files first (they may be easier to delete)
-                    if wal_path.exists():
+                    for sidecar in (wal_path, shm_path):
                         try:
-                            wal_path.unlink()
-                            logger.info("Deleted WAL file: %s", wal_path)
+                            sidecar.unlink()
+                            logger.info("Deleted SQLite sidecar file: %s", sidecar)
+                        except FileNotFoundError:
+                            pass
                         except Exception as exc:  # noqa: BLE001
-                            logger.warning("Failed to delete WAL file %s: %s", wal_path, exc)
-                    
-                    if shm_path.exists():
-                        try:
-                            shm_path.unlink()
-                            logger.info("Deleted SHM file: %s", shm_path)
-                        except Exception as exc:  # noqa: BLE001
-                            logger.warning("Failed to delete SHM file %s: %s", shm_path, exc)
-                    
+                            logger.warning("Failed to delete SQLite sidecar file %s: %s", sidecar, exc)
+
                     # Now delete the main database file
                     db_path.unlink()
-                    deleted = True
                     logger.info("Database file deleted successfully: %s", db_path)
                     break
                 except PermissionError as exc:
+                    # Fallback only: after the checkpoint a lock should be rare and short-lived
                     if attempt < max_attempts - 1:
-                        logger.debug("Database file locked, retrying in 0.5s (attempt %d/%d): %s", attempt + 1, max_attempts, exc)
-                        time.sleep(0.5)
+                        delay = 0.05 * 4**attempt
+                        logger.debug(
+                            "Database file locked, retrying in %.2fs (attempt %d/%d): %s",
+                            delay, attempt + 1, max_attempts, exc,
+                        )
+                        time.sleep(delay)
                     else:
                         logger.error("Failed to delete database file %s after %d attempts: file is locked - %s", db_path, max_attempts, exc)
                         raise
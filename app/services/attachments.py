@@ -2,24 +2,41 @@
 
 from __future__ import annotations
 
+import binascii
+import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+from urllib.parse import quote
 
 from loguru import logger
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, not_, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 from app.db.models import Attachment, InputEmail, PickleBatch
 from app.utils.file_operations import copy_file_safe
 from app.utils.json_helpers import safe_json_loads_list
 
+try:
+    # SIMD base64 (AVX2/AVX-512/NEON); binascii's scalar encoder is the fallback
+    import pybase64  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None  # type: ignore[assignment]
+
+_b64encode = pybase64.b64encode if pybase64 is not None else partial(binascii.b2a_base64, newline=False)
+
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".svg"}
 EMAIL_EXTENSIONS = {".eml", ".msg"}
+# Already-compressed formats: DEFLATE spends CPU on these for next to no size gain
+STORED_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".zip", ".gz", ".7z", ".rar", ".mp3", ".mp4", ".docx", ".xlsx", ".pptx"}
+)
 
 
 class AttachmentCategory(str, Enum):
@@ -36,13 +53,42 @@ class AttachmentExportResult:
     category: AttachmentCategory
 
 
+_CATEGORY_BY_EXTENSION = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, AttachmentCategory.IMAGES),
+    **dict.fromkeys(EMAIL_EXTENSIONS, AttachmentCategory.EMAILS),
+}
+
+
+def _file_suffix(file_name: str) -> str:
+    """``Path(file_name).suffix`` without building a Path for plain file names."""
+    if "/" in file_name or "\\" in file_name:
+        return Path(file_name).suffix
+    dot = file_name.rfind(".")
+    return file_name[dot:] if 0 < dot < len(file_name) - 1 else ""
+
+
 def detect_category(attachment: Attachment) -> AttachmentCategory:
-    suffix = Path(attachment.file_name or "").suffix.lower()
-    if suffix in IMAGE_EXTENSIONS:
-        return AttachmentCategory.IMAGES
-    if suffix in EMAIL_EXTENSIONS:
-        return AttachmentCategory.EMAILS
-    return AttachmentCategory.OTHER
+    suffix = _file_suffix(attachment.file_name or "").lower()
+    return _CATEGORY_BY_EXTENSION.get(suffix, AttachmentCategory.OTHER)
+
+
+# Threads for staged export copies; the work is I/O-bound, so more threads than cores pay off
+EXPORT_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Multiple of 3, so chunked base64 output concatenates to the same text as encoding at once
+_BASE64_CHUNK_SIZE = 48 * 1024
+# zlib level for deflated entries: about twice as fast as the default 6 on text, for
+# archives roughly a seventh larger; exports are written locally, so speed wins
+ZIP_COMPRESSLEVEL = 3
+
+# Rows fetched per round trip by list_attachment_records; bounds the ORM objects held at once
+LIST_RECORDS_CHUNK_SIZE = 1000
+
+
+def zip_compression_for(file_name: str) -> int:
+    """Return the zip compression method for an archive entry named ``file_name``."""
+    if _file_suffix(file_name).lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
 
 
 def build_destination_name(attachment: Attachment) -> str:
@@ -73,15 +119,37 @@ def build_destination_name(attachment: Attachment) -> str:
     return f"{prefix}_{base_name}"
 
 
+def _copy_export(planned: AttachmentExportResult) -> bool:
+    """Copy one planned export file; runs on a worker thread, so it must not touch the session."""
+    source_path = planned.source_path
+    destination_path = planned.destination_path
+    try:
+        copy_file_safe(source_path, destination_path, create_parents=False)
+        return True
+    except PermissionError as exc:
+        logger.error("Permission denied copying %s to %s: %s", source_path, destination_path, exc)
+    except OSError as exc:
+        logger.error("OS error copying %s to %s: %s", source_path, destination_path, exc)
+    except Exception as exc:
+        logger.exception("Unexpected error processing attachment %s: %s", planned.attachment_id, exc)
+    return False
+
+
 def export_attachments(
     session: Session,
     attachment_ids: Sequence[int],
     destination_root: Path,
     *,
     create_archive: bool = True,
+    stage_to_disk: bool = True,
 ) -> tuple[List[AttachmentExportResult], Path | None]:
     """Copy attachments into organized folders and optionally create a zip archive.
     
+    With ``stage_to_disk=False`` (only honoured together with ``create_archive``) the
+    source files are written straight into the archive and no folder copy is made;
+    ``destination_path`` in the results is then where the entry lands if the archive
+    is extracted into ``destination_root``.
+    
     Returns:
         Tuple of (export_results, archive_path)
         - export_results: List of successfully exported attachments
@@ -95,17 +163,21 @@ def export_attachments(
     if not attachment_ids:
         return [], None
 
+    stream_to_archive = create_archive and not stage_to_disk
     try:
-        destination_root.mkdir(parents=True, exist_ok=True)
+        # The archive sits next to destination_root, so streaming only needs the parent
+        (destination_root.parent if stream_to_archive else destination_root).mkdir(parents=True, exist_ok=True)
     except (OSError, PermissionError) as exc:
         logger.error("Failed to create destination directory %s: %s", destination_root, exc)
         raise
 
-    # Eagerly load the input_email relationship to ensure we can access subject_id
+    # Load the parent emails in one IN query; build_destination_name only reads these columns
     try:
         attachments = (
             session.query(Attachment)
-            .options(joinedload(Attachment.input_email))
+            .options(
+                selectinload(Attachment.input_email).load_only(InputEmail.subject_id, InputEmail.email_hash)
+            )
             .filter(Attachment.id.in_(attachment_ids))
             .all()
         )
@@ -119,68 +191,116 @@ def export_attachments(
 
     results: List[AttachmentExportResult] = []
     skipped_count = 0
+    archive_path: Path | None = None
+    claimed_paths: set[Path] = set()
+    pending_copies: List[AttachmentExportResult] = []
+    stream_archive: zipfile.ZipFile | None = None
+    if stream_to_archive:
+        archive_path = destination_root.with_suffix(".zip")
+        stream_archive = zipfile.ZipFile(
+            archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+        )
 
-    for attachment in attachments:
-        if not attachment.storage_path:
-            logger.warning("Attachment %s is missing a storage_path; skipping", attachment.id)
-            skipped_count += 1
-            continue
-
-        source_path = Path(attachment.storage_path)
-        if not source_path.exists():
-            logger.warning("Attachment source %s does not exist; skipping", source_path)
-            skipped_count += 1
-            continue
-
-        try:
-            category = detect_category(attachment)
-            category_dir = destination_root / category.value
-            category_dir.mkdir(parents=True, exist_ok=True)
-
-            destination_name = build_destination_name(attachment)
-            destination_path = category_dir / destination_name
-
-            # Check for duplicate filenames and append number if needed
-            original_destination = destination_path
-            counter = 1
-            while destination_path.exists():
-                stem = original_destination.stem
-                suffix = original_destination.suffix
-                destination_path = category_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-
-            copy_file_safe(source_path, destination_path, create_parents=True)
-            results.append(
-                AttachmentExportResult(
+    try:
+        for attachment in attachments:
+            if not attachment.storage_path:
+                logger.warning("Attachment %s is missing a storage_path; skipping", attachment.id)
+                skipped_count += 1
+                continue
+
+            source_path = Path(attachment.storage_path)
+            if not source_path.exists():
+                logger.warning("Attachment source %s does not exist; skipping", source_path)
+                skipped_count += 1
+                continue
+
+            try:
+                category = detect_category(attachment)
+                category_dir = destination_root / category.value
+
+                destination_name = build_destination_name(attachment)
+                destination_path = category_dir / destination_name
+
+                # Check for duplicate filenames and append number if needed
+                original_destination = destination_path
+                counter = 1
+                while destination_path in claimed_paths or (
+                    stream_archive is None and destination_path.exists()
+                ):
+                    stem = original_destination.stem
+                    suffix = original_destination.suffix
+                    destination_path = category_dir / f"{stem}_{counter}{suffix}"
+                    counter += 1
+
+                claimed_paths.add(destination_path)
+                planned = AttachmentExportResult(
                     attachment_id=attachment.id,
                     source_path=source_path,
                     destination_path=destination_path,
                     category=category,
                 )
-            )
-        except PermissionError as exc:
-            logger.error("Permission denied copying %s to %s: %s", source_path, destination_path, exc)
-            skipped_count += 1
-        except OSError as exc:
-            logger.error("OS error copying %s to %s: %s", source_path, destination_path, exc)
-            skipped_count += 1
-        except Exception as exc:
-            logger.exception("Unexpected error processing attachment %s: %s", attachment.id, exc)
-            skipped_count += 1
+                if stream_archive is None:
+                    # Copied on worker threads below, once every destination is claimed
+                    pending_copies.append(planned)
+                    continue
+                stream_archive.write(
+                    source_path,
+                    arcname=destination_path.relative_to(destination_root),
+                    compress_type=zip_compression_for(destination_path.name),
+                )
+                results.append(planned)
+            except PermissionError as exc:
+                logger.error("Permission denied copying %s to %s: %s", source_path, destination_path, exc)
+                skipped_count += 1
+            except OSError as exc:
+                logger.error("OS error copying %s to %s: %s", source_path, destination_path, exc)
+                skipped_count += 1
+            except Exception as exc:
+                logger.exception("Unexpected error processing attachment %s: %s", attachment.id, exc)
+                skipped_count += 1
+    finally:
+        if stream_archive is not None:
+            stream_archive.close()
+
+    if pending_copies:
+        for category_dir in {planned.destination_path.parent for planned in pending_copies}:
+            try:
+                category_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                # The copies into it fail and are counted below
+                logger.error("Failed to create export directory %s: %s", category_dir, exc)
+        # Copies are I/O-bound and release the GIL; only plain paths cross into the workers
+        if len(pending_copies) == 1:
+            copied = [_copy_export(pending_copies[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(EXPORT_COPY_WORKERS, len(pending_copies))) as executor:
+                copied = list(executor.map(_copy_export, pending_copies))
+        for planned, ok in zip(pending_copies, copied):
+            if ok:
+                results.append(planned)
+            else:
+                skipped_count += 1
 
     if skipped_count > 0:
         logger.warning("Skipped %d attachments during export", skipped_count)
 
-    archive_path: Path | None = None
-    if create_archive and results:
+    if stream_archive is not None:
+        if not results:
+            # Match the staged path, which never creates an archive for an empty export
+            archive_path.unlink(missing_ok=True)
+            archive_path = None
+    elif create_archive and results:
         archive_path = destination_root.with_suffix(".zip")
         try:
-            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            with zipfile.ZipFile(
+                archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+            ) as archive:
                 for result in results:
                     try:
                         archive.write(
                             result.destination_path,
                             arcname=result.destination_path.relative_to(destination_root),
+                            compress_type=zip_compression_for(result.destination_path.name),
                         )
                     except Exception as exc:
                         logger.error("Failed to add %s to archive: %s", result.destination_path, exc)
@@ -197,6 +317,21 @@ def export_attachments(
     return results, archive_path
 
 
+def _category_clause(category: AttachmentCategory):
+    """SQL form of ``detect_category(attachment) == category``, matched on the file name suffix."""
+    file_name = func.lower(Attachment.file_name)
+
+    def has_suffix(extensions: Iterable[str]):
+        # "%_" keeps Path.suffix semantics: a bare ".png" name has no suffix
+        return or_(*(file_name.like(f"%_{extension}") for extension in sorted(extensions)))
+
+    if category is AttachmentCategory.IMAGES:
+        return has_suffix(IMAGE_EXTENSIONS)
+    if category is AttachmentCategory.EMAILS:
+        return has_suffix(EMAIL_EXTENSIONS)
+    return not_(has_suffix(IMAGE_EXTENSIONS | EMAIL_EXTENSIONS))
+
+
 def list_attachment_records(
     session: Session,
     *,
@@ -212,9 +347,13 @@ def list_attachment_records(
 
     if batch_id is not None:
         stmt = stmt.where(InputEmail.pickle_batch_id == batch_id)
+    if category:
+        # Filter in SQL so rows of other categories are never loaded; detect_category below
+        # still has the final say
+        stmt = stmt.where(_category_clause(category))
 
     attachments: List[Dict] = []
-    for attachment, email, batch in session.execute(stmt):
+    for attachment, email, batch in session.execute(stmt.execution_options(yield_per=LIST_RECORDS_CHUNK_SIZE)):
         detected = detect_category(attachment)
         if category and detected != category:
             continue
@@ -249,10 +388,19 @@ def cleanup_exports(export_results: Iterable[AttachmentExportResult]) -> None:
             logger.warning("Failed to remove %s: %s", result.destination_path, exc)
 
 
+def _write_file_base64(handle: TextIO, path: Path) -> None:
+    """Write the base64 encoding of ``path`` to ``handle`` one chunk at a time."""
+    with path.open("rb") as source:
+        for chunk in iter(partial(source.read, _BASE64_CHUNK_SIZE), b""):
+            handle.write(_b64encode(chunk).decode("ascii"))
+
+
 def generate_image_grid_report(
     session: Session,
     attachment_ids: Sequence[int],
     output_path: Path,
+    *,
+    link_images_over: Optional[int] = None,
 ) -> Path:
     """Generate an HTML report with images in a grid layout, including numbers and URL information.
     
@@ -260,6 +408,9 @@ def generate_image_grid_report(
         session: Database session
         attachment_ids: List of attachment IDs to include
         output_path: Path where the HTML report should be saved
+        link_images_over: If set, images larger than this many bytes are copied into a
+            ``<report stem>_images`` folder beside the report and linked instead of being
+            embedded as base64. The report is then no longer a single self-contained file.
     
     Returns:
         Path to the generated HTML file
@@ -270,13 +421,22 @@ def generate_image_grid_report(
         PermissionError: If insufficient permissions
     """
     from app.db.models import Attachment, InputEmail
-    import base64
     
     if not attachment_ids:
         raise ValueError("No attachment IDs provided")
     
     try:
-        attachments = session.query(Attachment).filter(Attachment.id.in_(attachment_ids)).all()
+        # One IN query for the parent emails instead of a lazy load per image in the loop below
+        attachments = (
+            session.query(Attachment)
+            .options(
+                selectinload(Attachment.input_email).load_only(
+                    InputEmail.subject_id, InputEmail.subject, InputEmail.sender, InputEmail.url_parsed
+                )
+            )
+            .filter(Attachment.id.in_(attachment_ids))
+            .all()
+        )
     except Exception as exc:
         logger.error("Failed to query attachments for image grid: %s", exc)
         raise ValueError(f"Failed to load attachments from database: {exc}") from exc
@@ -290,6 +450,9 @@ def generate_image_grid_report(
     if not image_attachments:
         raise ValueError(f"No image attachments found in selection of {len(attachments)} attachments")
     
+    images_dir = output_path.parent / f"{output_path.stem}_images"
+    images_dir_created = False
+
     # Get related email information for each attachment
     image_data = []
     images_loaded = 0
@@ -304,9 +467,9 @@ def generate_image_grid_report(
             if email:
                 urls = safe_json_loads_list(email.url_parsed)
             
-            # Read image and convert to base64 for embedding
-            image_base64 = None
-            mime_type = None  # Initialize mime_type to avoid "cannot access local variable" error
+            # Linked images get a relative src; inline ones are base64-streamed into the report on write
+            image_src = None
+            inline_image = None
             if attachment.storage_path:
                 image_path = Path(attachment.storage_path)
                 if image_path.exists():
@@ -314,11 +477,22 @@ def generate_image_grid_report(
                         # Check file size to avoid loading huge images into memory
                         file_size = image_path.stat().st_size
                         MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB limit for base64 encoding
-                        if file_size > MAX_IMAGE_SIZE:
+                        if link_images_over is not None and file_size > link_images_over:
+                            # Linked files skip the base64 blow-up (and the size cap, as nothing is loaded)
+                            linked_name = f"{idx}_{image_path.name}"
+                            if not images_dir_created:
+                                # Created on first use, so reports with nothing linked leave no empty folder
+                                images_dir.mkdir(parents=True, exist_ok=True)
+                                images_dir_created = True
+                            copy_file_safe(image_path, images_dir / linked_name, create_parents=False)
+                            image_src = f"{images_dir.name}/{quote(linked_name)}"
+                            images_loaded += 1
+                        elif file_size > MAX_IMAGE_SIZE:
                             logger.warning("Image %s is too large (%d bytes), skipping base64 encoding", image_path, file_size)
                         else:
-                            image_bytes = image_path.read_bytes()
-                            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
+                            # Fail here, not halfway through writing the report, if it is unreadable
+                            with image_path.open("rb"):
+                                pass
                             # Determine MIME type from extension
                             suffix = image_path.suffix.lower()
                             mime_type = {
@@ -330,13 +504,11 @@ def generate_image_grid_report(
                                 ".tiff": "image/tiff",
                                 ".svg": "image/svg+xml",
                             }.get(suffix, "image/png")
+                            inline_image = (mime_type, image_path)
                             images_loaded += 1
                     except PermissionError as exc:
                         logger.warning("Permission denied reading image %s: %s", image_path, exc)
                         images_failed += 1
-                    except MemoryError as exc:
-                        logger.error("Out of memory reading image %s: %s", image_path, exc)
-                        images_failed += 1
                     except Exception as exc:
                         logger.warning("Failed to read image %s: %s", image_path, exc)
                         images_failed += 1
@@ -355,8 +527,8 @@ def generate_image_grid_report(
                 "urls": urls,
                 "email_subject": email.subject if email else None,
                 "email_sender": email.sender if email else None,
-                "image_base64": image_base64,
-                "mime_type": mime_type,
+                "image_src": image_src,
+                "inline_image": inline_image,
             })
         except Exception as exc:
             logger.exception("Unexpected error processing attachment %s for image grid: %s", attachment.id, exc)
@@ -366,7 +538,7 @@ def generate_image_grid_report(
         logger.warning("Failed to load %d images out of %d total", images_failed, len(image_attachments))
     
     # Generate HTML with grid layout
-    html_content = f"""<!DOCTYPE html>
+    parts: List[str | Path] = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -466,59 +638,65 @@ def generate_image_grid_report(
     </div>
     
     <div class="grid">
-"""
+"""]
     
     for img in image_data:
-        html_content += f"""        <div class="image-card">
+        parts.append(f"""        <div class="image-card">
             <div class="image-number">Image #{img['number']}</div>
             <div class="image-container">
-"""
+""")
         
-        if img['image_base64']:
-            html_content += f"""                <img src="data:{img['mime_type']};base64,{img['image_base64']}" alt="{img['file_name']}">
-"""
+        if img['image_src']:
+            parts.append(f"""                <img src="{img['image_src']}" alt="{img['file_name']}">
+""")
+        elif img['inline_image']:
+            mime_type, image_path = img['inline_image']
+            parts.append(f"""                <img src="data:{mime_type};base64,""")
+            parts.append(image_path)  # replaced by the file's base64 text when written
+            parts.append(f"""\" alt="{img['file_name']}">
+""")
         else:
-            html_content += f"""                <div class="no-image">Image not available</div>
-"""
+            parts.append(f"""                <div class="no-image">Image not available</div>
+""")
         
-        html_content += f"""            </div>
+        parts.append(f"""            </div>
             <div class="image-info">
                 <div><strong>File:</strong> {img['file_name']}</div>
-"""
+""")
         
         if img['subject_id']:
-            html_content += f"""                <div><strong>Subject ID:</strong> {img['subject_id']}</div>
-"""
+            parts.append(f"""                <div><strong>Subject ID:</strong> {img['subject_id']}</div>
+""")
         
         if img['email_subject']:
-            html_content += f"""                <div><strong>Email Subject:</strong> {img['email_subject']}</div>
-"""
+            parts.append(f"""                <div><strong>Email Subject:</strong> {img['email_subject']}</div>
+""")
         
         if img['email_sender']:
-            html_content += f"""                <div><strong>Sender:</strong> {img['email_sender']}</div>
-"""
+            parts.append(f"""                <div><strong>Sender:</strong> {img['email_sender']}</div>
+""")
         
         if img['urls']:
-            html_content += f"""                <div class="urls">
+            parts.append(f"""                <div class="urls">
                     <strong>Related URLs:</strong>
-"""
+""")
             for url in img['urls'][:5]:  # Limit to 5 URLs per image
-                html_content += f"""                    <a href="{url}" target="_blank">{url}</a>
-"""
+                parts.append(f"""                    <a href="{url}" target="_blank">{url}</a>
+""")
             if len(img['urls']) > 5:
-                html_content += f"""                    <div style="font-size: 10px; color: #999; margin-top: 4px;">... and {len(img['urls']) - 5} more</div>
-"""
-            html_content += """                </div>
-"""
+                parts.append(f"""                    <div style="font-size: 10px; color: #999; margin-top: 4px;">... and {len(img['urls']) - 5} more</div>
+""")
+            parts.append("""                </div>
+""")
         
-        html_content += """            </div>
+        parts.append("""            </div>
         </div>
-"""
+""")
     
-    html_content += """    </div>
+    parts.append("""    </div>
 </body>
 </html>
-"""
+""")
     
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -527,7 +705,14 @@ def generate_image_grid_report(
         raise
     
     try:
-        output_path.write_text(html_content, encoding="utf-8")
+        # Written piecewise, with images encoded straight from disk, so neither the image
+        # bytes nor a joined copy of the report is ever held in memory
+        with output_path.open("w", encoding="utf-8") as handle:
+            for part in parts:
+                if isinstance(part, Path):
+                    _write_file_base64(handle, part)
+                else:
+                    handle.write(part)
         logger.info("Generated image grid report with %d images (%d loaded, %d failed) at %s", 
                    len(image_data), images_loaded, images_failed, output_path)
     except (OSError, PermissionError) as exc:
@@ -11,6 +11,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.db.init_db import invalidate_schema
 from app.utils.error_handling import format_database_error
 from app.utils.validation import validate_table_name
 
@@ -218,6 +219,8 @@ def drop_table(engine: Engine, table_name: str) -> None:
         metadata = MetaData()
         table = Table(table_name, metadata, autoload_with=engine)
         table.drop(engine)
+        # Let the next page render recreate it if it is one of the application's tables
+        invalidate_schema(engine)
         logger.info("Dropped table %s", table_name)
     except Exception as exc:
         logger.error("Failed to drop table %s: %s", table_name, exc)
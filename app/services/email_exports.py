@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.config import AppConfig
 from app.db.models import OriginalAttachment, OriginalEmail
+from app.services.attachments import ZIP_COMPRESSLEVEL, zip_compression_for
 from app.utils import sha256_file
 
 
@@ -63,7 +64,9 @@ def build_attachments_zip(
     """Bundle existing attachment files into a ZIP payload."""
     buffer = io.BytesIO()
     added = False
-    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(
+        buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL
+    ) as archive:
         for attachment in attachments:
             file_name = attachment.get("file_name") or "attachment"
             storage_path = attachment.get("storage_path")
@@ -89,7 +92,7 @@ def build_attachments_zip(
             if not content_bytes:
                 continue
 
-            archive.writestr(file_name, content_bytes)
+            archive.writestr(file_name, content_bytes, compress_type=zip_compression_for(file_name))
             added = True
     if not added:
         return None
@@ -15,7 +15,7 @@ from sqlalchemy.orm import Session
 
 from app.config import AppConfig, load_config
 from app.db.models import InputEmail, PickleBatch
-from app.db.repositories import get_input_email, get_pickle_batch, list_emails_by_batch, list_pickle_batches
+from app.db.repositories import get_input_email, get_pickle_batch, iter_emails_by_batch, list_pickle_batches
 from app.parsers import extract_urls
 from app.services.shared import build_pickle_payload_record
 from app.utils.error_handling import format_database_error
@@ -80,9 +80,8 @@ def get_batches(session: Session) -> List[PickleBatch]:
 
 
 def get_emails_for_batch(session: Session, batch_id: int) -> List[Dict]:
-    # Eagerly load attachments to avoid N+1 queries
-    emails = list_emails_by_batch(session, batch_id, eager_load_attachments=True)
-    return [_serialize_email(email) for email in emails]
+    # Attachments are loaded per chunk to avoid N+1 queries; rows are serialized as they stream in
+    return [_serialize_email(email) for email in iter_emails_by_batch(session, batch_id, include_content=True)]
 
 
 def get_email_detail(session: Session, email_id: int) -> Optional[Dict]:
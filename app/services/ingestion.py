@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.config import AppConfig, load_config
 from app.db.models import Attachment, InputEmail, OriginalAttachment, OriginalEmail, ParserRun, PickleBatch
-from app.db.repositories import find_input_email_by_hash, register_pickle_batch, upsert_input_email
+from app.db.repositories import list_input_email_hashes, register_pickle_batch, upsert_input_email
 from app.parsers import ParsedAttachment
 from app.services.parsing import detect_candidate, run_parsing_pipeline
 from app.services.shared import apply_parsed_email_to_input, build_pickle_payload, summarize_parser_failures
@@ -202,6 +202,9 @@ def ingest_emails(
     MAX_EMAIL_SIZE = 50 * 1024 * 1024  # 50MB
     MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024  # 10MB
     
+    # Files stay in the input directory, so most of them are usually already ingested
+    known_hashes = list_input_email_hashes(session)
+
     for idx, file_path in enumerate(files, 1):
         # Update progress
         if progress_callback:
@@ -230,8 +233,7 @@ def ingest_emails(
 
         try:
             email_hash = sha256_digest(original_bytes)
-            existing = find_input_email_by_hash(session, email_hash)
-            if existing:
+            if email_hash in known_hashes:
                 logger.info("Skipping already ingested email %s", file_path)
                 continue
 
@@ -274,6 +276,8 @@ def ingest_emails(
                 logger.error("Failed to upsert InputEmail for %s: %s", file_path.name, exc)
                 skipped.append(f"{file_path.name}: Database error saving email record - {format_database_error(exc, 'save email record')}")
                 continue
+            # Duplicate files later in this run are skipped like previously ingested ones
+            known_hashes.add(email_hash)
             
             # Flush to ensure the email is persisted and we can check for existing attachments
             try:
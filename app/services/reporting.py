@@ -15,7 +15,7 @@ from html import escape
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from loguru import logger
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.config import AppConfig, load_config
 from app.utils.json_helpers import safe_json_loads_list
@@ -1074,22 +1074,7 @@ def _build_html_document(
     ).strip()
 
 
-def _inline_cid_resources(html: str, message) -> str:
-    cid_map: Dict[str, Tuple[str, str]] = {}
-    for part in message.walk():
-        if part.is_multipart():
-            continue
-        cid = part.get("Content-ID")
-        if not cid:
-            continue
-        payload = part.get_payload(decode=True) or b""
-        if not payload:
-            continue
-        cid_clean = cid.strip("<>")
-        cid_map[cid_clean] = (
-            part.get_content_type() or "application/octet-stream",
-            base64.b64encode(payload).decode("utf-8"),
-        )
+def _inline_cid_resources(html: str, cid_map: Dict[str, Tuple[str, str]]) -> str:
     inlined = html
     for cid, (mime, b64) in cid_map.items():
         inlined = inlined.replace(
@@ -1105,18 +1090,31 @@ def _extract_html_from_original(original_bytes: bytes) -> Optional[str]:
     except Exception:
         return None
     html = None
-    charset = "utf-8"
+    cid_map: Dict[str, Tuple[str, str]] = {}
+    # One walk finds the first HTML body and every inline Content-ID resource
     for part in message.walk():
-        if part.get_content_type() == "text/html":
+        if part.is_multipart():
+            continue
+        content_type = part.get_content_type()
+        cid = part.get("Content-ID")
+        if html is None and content_type == "text/html":
             payload = part.get_payload(decode=True) or b""
             charset = part.get_content_charset("utf-8")
             try:
                 html = payload.decode(charset, errors="replace")
             except Exception:
                 html = payload.decode("utf-8", errors="replace")
-            break
+        elif cid:
+            payload = part.get_payload(decode=True) or b""
+        else:
+            continue
+        if cid and payload:
+            cid_map[cid.strip("<>")] = (
+                content_type or "application/octet-stream",
+                base64.b64encode(payload).decode("utf-8"),
+            )
     if html:
-        return _inline_cid_resources(html, message)
+        return _inline_cid_resources(html, cid_map)
     return None
 
 
@@ -1201,6 +1199,7 @@ def generate_email_report(
 
     emails = (
         session.query(InputEmail)
+        .options(undefer_group("content"))
         .filter(InputEmail.id.in_(email_ids))
         .order_by(InputEmail.created_at.asc())
         .all()
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Iterable, List, Sequence
 
 from loguru import logger
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.config import AppConfig, load_config
 from app.db.models import InputEmail, StandardEmail
@@ -68,7 +68,11 @@ def promote_to_standard_emails(
     logger.info("Promoting %d emails to StandardEmail table (env=%s)", len(email_ids), cfg.env_name)
 
     emails: List[InputEmail] = (
-        session.query(InputEmail).filter(InputEmail.id.in_(email_ids)).order_by(InputEmail.id.asc()).all()
+        session.query(InputEmail)
+        .options(undefer_group("content"))
+        .filter(InputEmail.id.in_(email_ids))
+        .order_by(InputEmail.id.asc())
+        .all()
     )
 
     results: List[PromotionResult] = []
@@ -20,7 +20,7 @@ def prepare_page() -> AppState:
     _ensure_page_config()
 
     config = load_config()
-    init_db()
+    init_db(config=config)
     state = get_state(config=config)
 
     # Render shared sidebar (import locally to avoid circular dependencies)
@@ -11,7 +11,7 @@ import pandas as pd
 import streamlit as st
 from loguru import logger
 
-from app.db.init_db import session_scope
+from app.db.init_db import read_session_scope, session_scope
 from app.services.attachments import (
     AttachmentCategory,
     export_attachments,
@@ -28,7 +28,7 @@ def render(state: AppState) -> None:
     st.header("Attachments")
     st.write("Inspect extracted attachments and perform bulk download/export operations.")
 
-    with session_scope() as session:
+    with read_session_scope() as session:
         batches = get_batches(session)
 
     batch_options = {0: "All Batches"}
@@ -59,7 +59,7 @@ def render(state: AppState) -> None:
     state.attachments_filter = category_label
     category_filter = category_map[category_label]
 
-    with session_scope() as session:
+    with read_session_scope() as session:
         attachments = list_attachment_records(
             session,
             batch_id=state.selected_batch_id,
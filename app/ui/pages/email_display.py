@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 import math
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -60,7 +61,6 @@ def _html_to_text_for_display(html_content: str | None) -> str:
         return text
     except Exception:
         # Fallback: simple tag stripping
-        import re
         text = re.sub(r"<[^>]+>", " ", html_content)
         text = re.sub(r"\s+", " ", text).strip()
         if len(text) > 500:
@@ -68,6 +68,10 @@ def _html_to_text_for_display(html_content: str | None) -> str:
         return text
 
 
+# Timezone offset at the end of a time: - followed by digits (with optional colon)
+_TIMEZONE_SUFFIX_RE = re.compile(r"-\d{2}:?\d{2}$")
+
+
 def _format_date_for_display(date_str: str | None) -> str:
     """Format ISO date string for display.
     
@@ -92,13 +96,8 @@ def _format_date_for_display(date_str: str | None) -> str:
                     # Check if this is a timezone (format: HH:MM:SS-HH:MM or HH:MM:SS-HHMM)
                     # Timezone would be at the end after the time
                     # Pattern: digits:digits:digits followed by -digits:digits or -digitsdigits
-                    import re
-                    # Match timezone pattern: - followed by digits (with optional colon)
-                    timezone_pattern = r'-\d{2}:?\d{2}$'
-                    if re.search(timezone_pattern, time_part):
-                        # Remove timezone
-                        time_part = re.sub(timezone_pattern, '', time_part)
-                    elif time_part.count("-") > 2:  # Has timezone (old logic for compatibility)
+                    time_part, removed = _TIMEZONE_SUFFIX_RE.subn("", time_part)
+                    if not removed and time_part.count("-") > 2:  # Has timezone (old logic for compatibility)
                         # Find the last - which is likely the timezone separator
                         time_parts = time_part.rsplit("-", 1)
                         if len(time_parts) == 2:
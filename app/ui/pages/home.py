@@ -12,7 +12,7 @@ import streamlit as st
 from loguru import logger
 from sqlalchemy import func
 
-from app.db.init_db import session_scope
+from app.db.init_db import read_session_scope
 from app.db.models import Attachment, InputEmail, PickleBatch, StandardEmail
 from app.ui.state import AppState
 from app.ui.styles.animations import inject_reveal_animations
@@ -58,7 +58,7 @@ def _get_database_stats(state: AppState) -> Dict[str, object]:
     }
 
     try:
-        with session_scope() as session:
+        with read_session_scope() as session:
             stats["input_emails"] = session.query(func.count(InputEmail.id)).scalar() or 0
             stats["attachments"] = session.query(func.count(Attachment.id)).scalar() or 0
             stats["standard_emails"] = session.query(func.count(StandardEmail.id)).scalar() or 0
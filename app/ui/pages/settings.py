@@ -53,18 +53,10 @@ def _render_reset_dialog(state: AppState) -> None:
             
             with st.spinner("Resetting application..."):
                 try:
-                    import time
-                    
-                    # Close all database connections first
-                    from app.db.init_db import get_engine, get_session_factory
-                    engine = get_engine(config=state.config)
-                    session_factory = get_session_factory(config=state.config)
-                    
-                    # Dispose engine to close all connections
-                    engine.dispose()
-                    
-                    # Small delay to ensure SQLite releases file locks
-                    time.sleep(0.5)
+                    # Close all database connections first, including the read-only pool;
+                    # reset_application checkpoints the WAL, so no settling delay is needed
+                    from app.db.init_db import dispose_engines
+                    dispose_engines()
                     
                     if create_backup and backup_message:
                         backup_database(state.config, Path(backup_message))
@@ -88,8 +80,6 @@ def _render_reset_dialog(state: AppState) -> None:
                     
                     # Verify database was deleted if requested
                     if reset_db and db_path:
-                        # Wait a moment for file system to update
-                        time.sleep(0.2)
                         if db_path.exists():
                             st.error(f"❌ Database file still exists at {db_path}")
                             st.caption(f"Full path: {db_path}")
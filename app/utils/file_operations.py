@@ -10,11 +10,26 @@ This module provides file operation functions with:
 from __future__ import annotations
 
 import shutil
+import sys
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
+# Python 3.12 made shutil.copy2 use the native CopyFile2 API on Windows; on 3.11 it still
+# copies through a Python-level 1 MiB buffer. Linux and macOS already get sendfile/fcopyfile.
+_COPY_FILE2 = None
+if sys.platform == "win32" and sys.version_info < (3, 12):
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        _COPY_FILE2 = ctypes.windll.kernel32.CopyFile2
+        _COPY_FILE2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+        _COPY_FILE2.restype = ctypes.c_long  # HRESULT
+    except (ImportError, AttributeError, OSError):
+        _COPY_FILE2 = None
+
 
 class FileOperationError(Exception):
     """Base exception for file operation errors."""
@@ -178,6 +193,15 @@ def write_text_safe(
         raise FileWriteError(error_msg) from exc
 
 
+def _copy2(source: Path, destination: Path) -> None:
+    """Copy data and metadata like ``shutil.copy2``, natively on Windows when available."""
+    # CopyFile2 keeps timestamps and attributes like copy2; on failure shutil retries the
+    # copy and raises the matching OSError subclass
+    if _COPY_FILE2 is not None and _COPY_FILE2(str(source), str(destination), None) >= 0:
+        return
+    shutil.copy2(source, destination)
+
+
 def copy_file_safe(
     source: Path,
     destination: Path,
@@ -209,7 +233,7 @@ def copy_file_safe(
     
     for attempt in range(max_retries):
         try:
-            shutil.copy2(source, destination)
+            _copy2(source, destination)
             return
         except PermissionError as exc:
             error_msg = f"Permission denied copying {source.name} to {destination.name}"
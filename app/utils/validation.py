@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Optional
 
+# SHA256 hex digest; the common case is accepted with a single C-level match
+_EMAIL_HASH_RE = re.compile(r"[0-9a-fA-F]{64}")
+
 
 def validate_email_id(email_id: Optional[int]) -> tuple[bool, Optional[str]]:
     """Validate an email ID.
@@ -15,6 +19,10 @@ def validate_email_id(email_id: Optional[int]) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Fast path for the valid case; the checks below only build the error message
+    if type(email_id) is int and email_id > 0:
+        return True, None
+
     if email_id is None:
         return False, "Email ID is required"
     
@@ -36,6 +44,9 @@ def validate_batch_id(batch_id: Optional[int]) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if type(batch_id) is int and batch_id > 0:
+        return True, None
+
     if batch_id is None:
         return False, "Batch ID is required"
     
@@ -114,6 +125,9 @@ def validate_email_hash(email_hash: Optional[str]) -> tuple[bool, Optional[str]]
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if type(email_hash) is str and _EMAIL_HASH_RE.fullmatch(email_hash):
+        return True, None
+
     if not email_hash:
         return False, "Email hash is required"
     
@@ -145,6 +159,9 @@ def validate_limit(limit: Optional[int], min_value: int = 1, max_value: int = 10
     """
     if limit is None:
         return True, None  # None is allowed for "no limit"
+
+    if type(limit) is int and min_value <= limit <= max_value:
+        return True, None
     
     if not isinstance(limit, int):
         return False, f"Limit must be an integer, got {type(limit).__name__}"
@@ -476,3 +476,40 @@ def test_export_attachments_handles_empty_input(db_session: Session, tmp_path: P
     assert results == []
     assert archive_path is None
 
+
+def test_generate_image_grid_report_links_images_over_threshold(db_session: Session, tmp_path: Path, temp_config):
+    """Images above link_images_over are copied beside the report instead of inlined."""
+    email = InputEmail(email_hash="linked_image_test", subject_id="2025-01-25")
+    db_session.add(email)
+    db_session.flush()
+
+    big_image = tmp_path / "big shot.png"
+    big_image.write_bytes(b"\x89PNG" + b"x" * 2048)
+    small_image = tmp_path / "small.png"
+    small_image.write_bytes(b"\x89PNG")
+    attachments = [
+        Attachment(
+            input_email=email,
+            file_name=path.name,
+            file_type="image/png",
+            file_size_bytes=path.stat().st_size,
+            storage_path=str(path),
+        )
+        for path in (big_image, small_image)
+    ]
+    db_session.add_all(attachments)
+    db_session.flush()
+
+    report_path = tmp_path / "reports" / "grid.html"
+    generate_image_grid_report(
+        db_session,
+        attachment_ids=[attachment.id for attachment in attachments],
+        output_path=report_path,
+        link_images_over=1024,
+    )
+
+    html_content = report_path.read_text(encoding="utf-8")
+    linked = report_path.parent / "grid_images" / "1_big shot.png"
+    assert linked.read_bytes() == big_image.read_bytes()
+    assert 'src="grid_images/1_big%20shot.png"' in html_content
+    assert html_content.count("data:image/png;base64,") == 1
@@ -4,7 +4,7 @@ import zipfile
 from pathlib import Path
 
 from app.db.models import Attachment, InputEmail
-from app.services.attachments import export_attachments
+from app.services.attachments import AttachmentCategory, export_attachments, list_attachment_records
 
 
 def _create_email_with_attachment(db_session, source_file: Path) -> Attachment:
@@ -67,3 +67,47 @@ def test_export_attachments_skips_missing_files(db_session, tmp_path, temp_confi
     assert results == []
     assert archive is None
 
+
+def test_export_attachments_streams_into_archive_without_staging(db_session, tmp_path, temp_config):
+    source_file = tmp_path / "evidence.png"
+    source_file.write_bytes(b"binary-image")
+
+    attachment = _create_email_with_attachment(db_session, source_file)
+
+    destination_root = temp_config.output_dir / "exports_streamed"
+    results, archive_path = export_attachments(
+        db_session, [attachment.id], destination_root, stage_to_disk=False
+    )
+
+    assert len(results) == 1
+    assert not destination_root.exists()
+    assert archive_path is not None and archive_path.exists()
+    with zipfile.ZipFile(archive_path, "r") as archive:
+        assert archive.namelist() == ["images/SUBJECT123_evidence.png"]
+        assert archive.read("images/SUBJECT123_evidence.png") == b"binary-image"
+        # PNG data is already compressed, so it is stored rather than deflated again
+        assert archive.getinfo("images/SUBJECT123_evidence.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_list_attachment_records_filters_by_category(db_session):
+    email = InputEmail(email_hash="hash-categories")
+    db_session.add(email)
+    db_session.flush()
+    for file_name in ("photo.PNG", "forwarded.eml", "report.pdf", ".png"):
+        db_session.add(
+            Attachment(
+                input_email=email,
+                file_name=file_name,
+                file_type="application/octet-stream",
+                file_size_bytes=1,
+                storage_path=file_name,
+            )
+        )
+    db_session.commit()
+
+    def names(category):
+        return sorted(record["file_name"] for record in list_attachment_records(db_session, category=category))
+
+    assert names(AttachmentCategory.IMAGES) == ["photo.PNG"]
+    assert names(AttachmentCategory.EMAILS) == ["forwarded.eml"]
+    assert names(AttachmentCategory.OTHER) == [".png", "report.pdf"]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.config import load_config
+from app.config_store import save_config
+
+
+def test_load_config_is_cached_until_env_file_changes(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("EMAIL_HANDLER_ENV", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("EMAIL_HANDLER_ENV=first\n", encoding="utf-8")
+
+    first = load_config(env_file)
+    assert load_config(env_file) is first
+
+    save_config(first, env_file)
+    assert load_config(env_file) is not first
+
+
+def test_save_config_rewrites_keys_in_place(tmp_path: Path, temp_config):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# local settings\nOTHER_KEY=keep\nEMAIL_HANDLER_ENV=old\n",
+        encoding="utf-8",
+    )
+
+    save_config(temp_config, env_file)
+
+    lines = env_file.read_text(encoding="utf-8").splitlines()
+    assert lines[:3] == ["# local settings", "OTHER_KEY=keep", "EMAIL_HANDLER_ENV=test"]
+    assert f"EMAIL_HANDLER_DATABASE_URL={temp_config.database_url}" in lines
+    assert sum(line.startswith("EMAIL_HANDLER_ENV=") for line in lines) == 1
+
+
+def test_load_config_picks_up_environment_changes(tmp_path: Path, monkeypatch):
+    env_file = tmp_path / ".env"
+    monkeypatch.setenv("EMAIL_HANDLER_ENV", "first")
+    assert load_config(env_file).env_name == "first"
+
+    monkeypatch.setenv("EMAIL_HANDLER_ENV", "second")
+    assert load_config(env_file).env_name == "second"
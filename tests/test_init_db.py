@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import importlib
+import sqlite3
+from contextlib import closing
+
+import pytest
+from sqlalchemy import func, inspect, select
+from sqlalchemy.exc import OperationalError
+
+from app.db.init_db import (
+    bulk_session_scope,
+    get_engine,
+    get_read_engine,
+    init_db,
+    invalidate_schema,
+    read_session_scope,
+    reset_engine,
+    session_scope,
+)
+from app.db.models import PickleBatch
+
+init_db_module = importlib.import_module("app.db.init_db")
+
+
+@pytest.fixture()
+def configured_engine(temp_config):
+    reset_engine(temp_config)
+    yield temp_config
+    init_db_module._stop_sqlite_maintenance()
+    init_db_module._dispose_read_engine()
+    init_db_module._ENGINE.dispose()
+    init_db_module._ENGINE = None
+    init_db_module._SESSION_FACTORY = None
+
+
+def test_read_session_scope_sees_committed_writes(configured_engine):
+    with session_scope() as session:
+        session.add(PickleBatch(batch_name="batch-1", file_path="batch-1.pkl"))
+
+    read_engine = get_read_engine()
+    assert read_engine is not get_engine()
+    assert read_engine.url.query.get("mode") == "ro"
+
+    with read_session_scope() as session:
+        assert session.scalar(select(func.count(PickleBatch.id))) == 1
+
+
+def test_read_session_scope_rejects_writes(configured_engine):
+    with pytest.raises(OperationalError):
+        with read_session_scope() as session:
+            session.add(PickleBatch(batch_name="batch-2", file_path="batch-2.pkl"))
+            session.flush()
+
+
+def test_bulk_session_scope_commits_in_chunks(configured_engine):
+    with bulk_session_scope(batch_size=2) as bulk:
+        for index in range(3):
+            bulk.session.add(PickleBatch(batch_name=f"bulk-{index}", file_path=f"bulk-{index}.pkl"))
+            bulk.mark()
+        # Two rows were committed by mark(); the third is still pending
+        assert bulk.pending == 1
+
+    with read_session_scope() as session:
+        assert session.scalar(select(func.count(PickleBatch.id))) == 3
+
+
+def test_schema_patches_stamp_sqlite_user_version(configured_engine):
+    with get_engine().connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    assert version == init_db_module._SCHEMA_VERSION
+
+
+def test_init_db_recreates_tables_after_invalidate_schema(configured_engine):
+    engine = get_engine()
+    PickleBatch.__table__.drop(engine)
+
+    init_db(config=configured_engine)
+    assert not inspect(engine).has_table("pickle_batches")
+
+    invalidate_schema(engine)
+    init_db(config=configured_engine)
+    assert inspect(engine).has_table("pickle_batches")
+
+
+def test_new_sqlite_database_uses_incremental_auto_vacuum(configured_engine):
+    with get_engine().connect() as conn:
+        # 2 == INCREMENTAL
+        assert conn.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2
+
+
+def test_new_sqlite_database_uses_8k_pages(configured_engine):
+    with get_engine().connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA page_size").scalar() == 8192
+
+
+def test_read_connections_get_per_connection_pragmas(configured_engine):
+    with get_read_engine().connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -40000
+        assert conn.exec_driver_sql("PRAGMA mmap_size").scalar() == 268435456
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+
+
+def test_sqlite_maintenance_reclaims_free_pages(configured_engine):
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE scratch (payload TEXT)")
+        conn.exec_driver_sql(
+            "INSERT INTO scratch SELECT hex(randomblob(4000)) FROM "
+            "(WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 200) SELECT i FROM n)"
+        )
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE scratch")
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() > 1
+
+    init_db_module._run_sqlite_maintenance(engine)
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() == 0
+
+
+@pytest.fixture()
+def rollback_journal_database(temp_config):
+    """A database file created before the app switched SQLite to WAL."""
+    db_path = temp_config.database_url.removeprefix("sqlite:///")
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("CREATE TABLE legacy (id INTEGER)")
+        conn.commit()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+
+def test_existing_rollback_journal_database_is_switched_to_wal(rollback_journal_database, configured_engine):
+    with get_engine().connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
@@ -5,6 +5,9 @@ from app.parsers.parser_email import (
     _build_subject_id,
     _clean_timestamp_from_subject,
     parse_eml_bytes,
+    parse_input_email,
+    parse_input_emails,
+    parse_standard_email,
 )
 
 
@@ -174,3 +177,55 @@ def test_subject_id_fallback_to_body_subject():
     # Should use body Subject field as fallback
     assert parsed.subject_id == "Alert-2025-001"
 
+
+def test_parse_input_emails_preserves_order(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"email_{index}.eml"
+        message = EmailMessage()
+        message["From"] = f"sender{index}@example.com"
+        message.set_content(f"Body {index}")
+        path.write_bytes(message.as_bytes())
+        paths.append(path)
+
+    parsed = list(parse_input_emails(paths, workers=2))
+
+    assert [item.sender for item in parsed] == [f"sender{index}@example.com" for index in range(3)]
+
+
+def test_parse_standard_email_reuses_extractor_results(tmp_path, monkeypatch):
+    import app.parsers.parser_email as parser_email
+
+    calls = []
+    original = parser_email.extract_phone_numbers
+
+    def counting_extract(text, *args, **kwargs):
+        calls.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(parser_email, "extract_phone_numbers", counting_extract)
+    path = tmp_path / "standard.eml"
+    path.write_bytes(make_test_email())
+
+    standard = parse_standard_email(path)
+
+    assert "+18881111111" in standard.body_text_numbers
+    assert len(calls) == 1
+
+
+def test_parse_input_email_from_path_matches_bytes(tmp_path):
+    raw = (
+        b"From: alerts@example.com\r\n"
+        b"Subject: Crlf\r\n"
+        b"Content-Type: text/html; charset=utf-8\r\n"
+        b"Content-Transfer-Encoding: 8bit\r\n"
+        b"\r\n"
+        b"<p>Line one</p>\r\n<p>Line two</p>\r\n"
+    )
+    path = tmp_path / "crlf.eml"
+    path.write_bytes(raw)
+
+    from_path = parse_input_email(path)
+
+    assert from_path.model_dump() == parse_eml_bytes(raw).model_dump()
+    assert from_path.body_html.endswith("</p>\r\n")
@@ -31,3 +31,16 @@ def test_extract_urls_handles_fanged_urls():
     
     # All normalized URLs should use standard protocols
     assert all(item.normalized.startswith(("http://", "https://")) for item in results)
+
+
+def test_extract_urls_does_not_split_fanged_www_urls():
+    results = extract_urls("Report hxxp://www.evil.com/login now")
+    assert [(item.original, item.normalized) for item in results] == [
+        ("hxxp://www.evil.com/login", "http://www.evil.com/login")
+    ]
+
+
+def test_fanged_domains_only_match_from_label_start():
+    blob = "A" * 100_000
+    results = extract_urls(f"{blob}[.]com and {blob} then evil[.]com")
+    assert [item.normalized for item in results] == ["https://evil.com"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from app.db import repositories
+from app.db.models import InputEmail, PickleBatch
+from app.db.repositories import (
+    bulk_upsert_input_emails,
+    get_input_email,
+    iter_emails_by_batch,
+    list_emails_by_batch,
+    list_input_emails,
+    register_pickle_batch,
+    upsert_input_email,
+)
+
+HASH_A = "a" * 64
+HASH_B = "b" * 64
+
+
+def test_upsert_input_email_inserts_then_updates(db_session):
+    inserted = upsert_input_email(db_session, InputEmail(email_hash=HASH_A, subject="First"))
+    assert inserted.id is not None
+    assert inserted.parse_status == "success"
+
+    updated = upsert_input_email(db_session, InputEmail(email_hash=HASH_A, subject="Second"))
+    db_session.commit()
+
+    assert updated.id == inserted.id
+    assert updated.subject == "Second"
+    assert db_session.scalars(select(InputEmail)).all() == [updated]
+
+
+def test_upsert_input_email_inserts_columns_outside_upsert_set(db_session):
+    batch = register_pickle_batch(db_session, PickleBatch(batch_name="batch", file_path="batch.pkl"))
+    db_session.flush()
+
+    inserted = upsert_input_email(db_session, InputEmail(email_hash=HASH_A, pickle_batch_id=batch.id))
+    db_session.commit()
+
+    assert inserted.pickle_batch_id == batch.id
+
+
+@pytest.mark.parametrize("sqlite_upsert", [True, False], ids=["on-conflict", "fallback"])
+def test_upsert_input_email_resets_unset_columns(db_session, monkeypatch, sqlite_upsert):
+    monkeypatch.setattr(repositories, "_supports_sqlite_upsert", lambda session: sqlite_upsert)
+    upsert_input_email(
+        db_session,
+        InputEmail(email_hash=HASH_A, parse_status="failed", parse_error="boom", sender="me", subject="Old"),
+    )
+    db_session.commit()
+
+    updated = upsert_input_email(db_session, InputEmail(email_hash=HASH_A, subject="New"))
+    db_session.commit()
+    db_session.refresh(updated)
+
+    assert updated.subject == "New"
+    assert updated.sender is None
+    assert updated.parse_error is None
+    assert updated.parse_status == "success"
+
+
+def test_upsert_paths_reset_unset_columns_identically(db_session, monkeypatch):
+    def reupsert(email_hash: str, sqlite_upsert: bool) -> dict:
+        monkeypatch.setattr(repositories, "_supports_sqlite_upsert", lambda session: sqlite_upsert)
+        upsert_input_email(
+            db_session,
+            InputEmail(
+                email_hash=email_hash,
+                parse_status="failed",
+                parse_error="boom",
+                cc='["cc@example.com"]',
+                model_confidence=0.5,
+                knowledge_data={"k": "v"},
+            ),
+        )
+        db_session.commit()
+        email = upsert_input_email(db_session, InputEmail(email_hash=email_hash, subject="Reparsed"))
+        db_session.commit()
+        db_session.refresh(email)
+        return {column: getattr(email, column) for column in repositories.UPSERT_COLUMNS}
+
+    on_conflict = reupsert(HASH_A, sqlite_upsert=True)
+    fallback = reupsert(HASH_B, sqlite_upsert=False)
+
+    assert on_conflict == fallback
+    assert on_conflict["parse_error"] is None and on_conflict["knowledge_data"] is None
+
+
+def test_bulk_upsert_input_emails(db_session):
+    upsert_input_email(db_session, InputEmail(email_hash=HASH_A, subject="Old"))
+    bulk_upsert_input_emails(
+        db_session,
+        [
+            {"email_hash": HASH_A, "subject": "New"},
+            {"email_hash": HASH_B, "subject": "Other"},
+        ],
+    )
+    db_session.commit()
+
+    rows = db_session.scalars(
+        select(InputEmail).order_by(InputEmail.email_hash).execution_options(populate_existing=True)
+    ).all()
+    assert [(row.email_hash, row.subject) for row in rows] == [(HASH_A, "New"), (HASH_B, "Other")]
+
+
+def test_body_content_is_deferred_for_lists(db_session):
+    email = upsert_input_email(db_session, InputEmail(email_hash=HASH_A, body_html="<p>Body</p>"))
+    assert email.body_html == "<p>Body</p>"
+    db_session.commit()
+    db_session.expunge_all()
+
+    listed = list(list_input_emails(db_session))
+    assert "body_html" not in listed[0].__dict__
+    db_session.expunge_all()
+
+    detail = get_input_email(db_session, listed[0].id)
+    assert detail.__dict__["body_html"] == "<p>Body</p>"
+
+
+def test_list_and_iter_emails_by_batch(db_session):
+    batch = register_pickle_batch(db_session, PickleBatch(batch_name="batch", file_path="batch.pkl"))
+    db_session.flush()
+    for index in range(3):
+        db_session.add(InputEmail(email_hash=f"{index:064x}", subject=f"Email {index}", pickle_batch_id=batch.id))
+    db_session.commit()
+
+    everything = list_emails_by_batch(db_session, batch.id, eager_load_attachments=True)
+    page = list_emails_by_batch(db_session, batch.id, eager_load_attachments=True, offset=1, limit=1)
+    streamed = list(iter_emails_by_batch(db_session, batch.id, chunk_size=2))
+
+    assert len(everything) == 3
+    assert page == everything[1:2]
+    assert streamed == everything